@@ -194,6 +194,12 @@ def rename(ctx, **kwargs):
 @click.argument("sources", nargs=-1, required=True, type=click.Path(exists=True))
 @add_options(common_options)
 @add_options(collection_options)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of sources to archive in parallel",
+)
 @click.pass_context
 def zip(ctx, **kwargs):
     """
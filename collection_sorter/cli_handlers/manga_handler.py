@@ -158,13 +158,12 @@ class MangaCommandHandler(CommandHandler):
             archived_count = 0
             moved_count = 0
 
+            destination = destination_path.path if destination_path else None
             for source in source_paths:
                 # Create the manga processor template
                 template = MangaProcessorTemplate(
                     source_path=source.path,
-                    destination_path=(
-                        destination_path.path if destination_path else None
-                    ),
+                    destination_path=destination,
                     template_func=manga_template_function,
                     author_folders=self.author_folders,
                     archive=self.archive,
@@ -470,17 +469,12 @@ class MangaCommandHandlerTemplateMethod(TemplateMethodCommandHandler):
                 # Process each manga inside the author folder
                 for manga_dir in source.path.iterdir():
                     if manga_dir.is_dir():
-                        manga_name = manga_dir.name
-                        # Create each manga directory inside author folder
-                        manga_dest = author_dest / manga_name.split("]")[-1].strip()
-                        os.makedirs(manga_dest, exist_ok=True)
+                        manga_title = manga_dir.name.split("]")[-1].strip()
 
                         # Copy or archive files
                         if self.archive:
                             # Create archive
-                            zip_path = (
-                                author_dest / f"{manga_name.split(']')[-1].strip()}.zip"
-                            )
+                            zip_path = author_dest / f"{manga_title}.zip"
                             import zipfile
 
                             with zipfile.ZipFile(
@@ -497,6 +491,10 @@ class MangaCommandHandlerTemplateMethod(TemplateMethodCommandHandler):
 
                             self.stats["archived"] += 1
                         else:
+                            # Create each manga directory inside author folder
+                            manga_dest = author_dest / manga_title
+                            os.makedirs(manga_dest, exist_ok=True)
+
                             # Copy files
                             for file_path in manga_dir.glob("*"):
                                 if file_path.is_file():
@@ -523,11 +521,12 @@ class MangaCommandHandlerTemplateMethod(TemplateMethodCommandHandler):
                 return Result.failure(errors)
 
         # Regular processing for non-test cases
+        destination = destination_path.path if destination_path else None
         for source in source_paths:
             # Create the manga processor template
             template = MangaProcessorTemplate(
                 source_path=source.path,
-                destination_path=destination_path.path if destination_path else None,
+                destination_path=destination,
                 template_func=manga_template_function,
                 author_folders=self.author_folders,
                 archive=self.archive,
@@ -6,6 +6,7 @@ using the various patterns we've implemented.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union, cast
 
@@ -49,6 +50,7 @@ class ZipCommandHandler(CommandHandler):
         duplicate_strategy: Optional[str] = None,
         duplicates_dir: Optional[str] = None,
         compression_level: int = 6,
+        jobs: Optional[int] = None,
         config: Optional[Dict[str, Any]] = None,
     ):
         """
@@ -64,6 +66,8 @@ class ZipCommandHandler(CommandHandler):
             duplicate_strategy: Strategy for handling duplicates
             duplicates_dir: Directory to move duplicates to
             compression_level: ZIP compression level (0-9)
+            jobs: Number of sources archived in parallel, defaults to one
+                per CPU
             config: Optional configuration dictionary
         """
         self.sources = sources
@@ -75,6 +79,7 @@ class ZipCommandHandler(CommandHandler):
         self.duplicate_strategy = duplicate_strategy
         self.duplicates_dir = duplicates_dir
         self.compression_level = compression_level
+        self.jobs = jobs
         self.config = config or {}
 
         # Create duplicate handler
@@ -102,12 +107,18 @@ class ZipCommandHandler(CommandHandler):
                 compression_level=self.compression_level,
             )
 
-            # Create the batch processor for processing multiple directories
+            # Create the batch processor for processing multiple directories,
+            # one at a time when the user may be prompted
+            if self.interactive or self.duplicate_strategy == "ask":
+                max_workers = 1
+            else:
+                max_workers = self.jobs or min(os.cpu_count() or 1, len(self.sources))
             processor = BatchProcessorTemplate(
                 directory_processor=archiver,
                 dry_run=self.dry_run,
                 duplicate_handler=self.duplicate_handler,
                 continue_on_error=True,
+                max_workers=max_workers,
             )
 
             # Process sources
@@ -178,6 +189,7 @@ class ZipCommandHandler(CommandHandler):
         # Get command-specific configuration
         zip_config = config_manager.get_command_config("zip")
         compression_level = zip_config.get("compression_level", 6)
+        jobs = zip_config.get("jobs")
 
         # Create the handler
         return cls(
@@ -190,6 +202,7 @@ class ZipCommandHandler(CommandHandler):
             duplicate_strategy=duplicate_strategy,
             duplicates_dir=duplicates_dir,
             compression_level=compression_level,
+            jobs=jobs,
             config=zip_config,
         )
 
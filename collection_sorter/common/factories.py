@@ -438,10 +438,7 @@ class ConfigBasedProcessorFactory(ProcessorFactory):
         Returns:
             Configured MangaProcessorTemplate
         """
-        from collection_sorter.templates.processors import (
-            MangaProcessorTemplate,
-            MangaProcessorValidator,
-        )
+        from collection_sorter.templates.processors import MangaProcessorTemplate
 
         # Use provided values or get from config
         dry_run = (
@@ -465,10 +462,7 @@ class ConfigBasedProcessorFactory(ProcessorFactory):
             dry_run=dry_run,
         )
 
-        # Create validator for parameter validation
-        validator = MangaProcessorValidator()
-
-        # Prepare parameters for validation
+        # Prepare parameters, MangaProcessorTemplate validates them itself
         params = {
             "source_path": source_path,
             "destination_path": destination_path,
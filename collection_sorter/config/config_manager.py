@@ -286,7 +286,8 @@ class ConfigManager:
             "log_level": ("logging", "log_level"),
             # UI settings
             "interactive": ("ui", "interactive"),
-            # Command-specific settings can be added here
+            # Command-specific settings
+            "jobs": ("zip", "jobs"),
         }
 
         # Process each argument
@@ -131,6 +131,9 @@ class ZipConfig(BaseModel):
 
     nested: bool = Field(False, description="Create nested archives")
     compression_level: int = Field(6, description="Compression level (0-9)")
+    jobs: Optional[int] = Field(
+        None, description="Number of sources archived in parallel"
+    )
 
 
 class AppConfig(BaseModel):
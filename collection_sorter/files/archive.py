@@ -0,0 +1,86 @@
+"""
+Archive helpers for Collection Sorter.
+
+This module holds the settings shared by everything that writes zip
+archives, so manga and plain directory archives compress files the same way.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Union
+from zipfile import ZIP_STORED, ZipFile, ZipInfo
+
+from collection_sorter.files.move import COPY_BUFFER_SIZE
+
+# Formats that deflate cannot shrink, stored as is to save compression time
+PRECOMPRESSED_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".avif",
+        ".jxl",
+        ".mp3",
+        ".flac",
+        ".ogg",
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".webm",
+        ".zip",
+        ".cbz",
+        ".rar",
+        ".cbr",
+        ".7z",
+        ".gz",
+        ".xz",
+        ".bz2",
+    }
+)
+
+
+def compress_type(filename: str) -> Optional[int]:
+    """
+    Choose the zip compression for a file.
+
+    Args:
+        filename: Name of the file being archived
+
+    Returns:
+        ZIP_STORED for already compressed formats, None for the archive default
+    """
+    if os.path.splitext(filename)[1].lower() in PRECOMPRESSED_EXTENSIONS:
+        return ZIP_STORED
+    return None
+
+
+def write_file(zf: ZipFile, path: Union[str, Path], arcname: Union[str, Path]) -> None:
+    """
+    Add a file to an archive, streaming it through the compressor in large chunks.
+
+    ZipFile.write feeds the compressor 8 KiB at a time; larger chunks give
+    deflate more input per call and cut the per-chunk Python overhead.
+
+    Args:
+        zf: Archive open for writing
+        path: File to add
+        arcname: Name of the file within the archive
+    """
+    zinfo = ZipInfo.from_file(path, arcname)
+    method = compress_type(zinfo.filename)
+    zinfo.compress_type = zf.compression if method is None else method
+    # ZipFile.write copies the archive level the same way
+    if hasattr(zinfo, "compress_level"):
+        zinfo.compress_level = zf.compresslevel
+    else:  # Python < 3.13
+        zinfo._compresslevel = zf.compresslevel
+
+    buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+    with open(path, "rb", buffering=0) as src, zf.open(zinfo, "w") as dst:
+        while True:
+            size = src.readinto(buffer)
+            if not size:
+                break
+            dst.write(buffer[:size])
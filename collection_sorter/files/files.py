@@ -1,4 +1,5 @@
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import Callable, Iterator, List, Set, Union
@@ -85,6 +86,21 @@ class CollectionPath:
         """
         return self._recursive_collect(self._path)
 
+    def collect_with_filter(self, predicate: Callable[[str], bool]) -> Iterator[Path]:
+        """
+        Lazily collect the files, recursively, whose name matches a predicate.
+
+        The predicate only sees the bare file name, so unwanted files are
+        skipped before any Path is built or stat call made for them.
+
+        :param predicate: A callable that returns True for file names to keep.
+        :return: An iterator of matching file paths.
+        """
+        for root, _, files in os.walk(self._path):
+            for name in files:
+                if predicate(name):
+                    yield Path(root, name)
+
     def get_folders(self) -> List[Path]:
         """
         Get all folders in the current path.
@@ -122,10 +138,9 @@ class CollectionPath:
 
         :param function: A callable that takes a file path as an argument.
         """
-        files = self.get_files()
-        for file in files:
-            source_path = str(file.absolute())
-            function(source_path)
+        # The collection path is resolved, so its files are already absolute
+        for file in self.get_files():
+            function(str(file))
 
     def __str__(self) -> str:
         """
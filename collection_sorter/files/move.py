@@ -1,7 +1,9 @@
+import errno
 import logging
+import os
 import shutil
 from pathlib import Path
-from typing import Callable, Optional, Union
+from typing import BinaryIO, Callable, Optional, Union
 
 from collection_sorter.common.exceptions import FileOperationError
 from collection_sorter.files.duplicates import DuplicateHandler, DuplicateStrategy
@@ -9,6 +11,19 @@ from collection_sorter.files.files import CollectionPath
 
 logger = logging.getLogger("move")
 
+_copy_file_range = getattr(os, "copy_file_range", None)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl that makes a file share the data blocks of another (reflink)
+_FICLONE = 0x40049409
+
+# Chunk size for copies that have to go through user space
+COPY_BUFFER_SIZE = 1 << 20
+
 
 def move_file(
     source_path: Union[str, Path],
@@ -177,7 +192,7 @@ def copy_file(
 
         # Perform the actual copy
         if not (duplicate_handler and duplicate_handler.dry_run):
-            shutil.copy2(src_path, final_dst_path)
+            copy_file_contents(str(src_path), str(final_dst_path))
             logger.info(f"Copied: {src_path} -> {final_dst_path}")
         else:
             logger.info(f"Would copy: {src_path} -> {final_dst_path}")
@@ -305,6 +320,128 @@ def move_folder(
         )
 
 
+def _clone_file(infd: int, outfd: int) -> bool:
+    """
+    Clone a file's data blocks on a copy-on-write file system.
+
+    Args:
+        infd: Source file descriptor
+        outfd: Destination file descriptor
+
+    Returns:
+        True if the destination now shares the source's data
+    """
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(outfd, _FICLONE, infd)
+    except OSError:
+        # Not btrfs/XFS, or the files are on different file systems
+        return False
+    return True
+
+
+def _copy_file_object(fsrc: BinaryIO, fdst: BinaryIO) -> None:
+    """
+    Copy an open file in large chunks through a single reused buffer.
+
+    Args:
+        fsrc: Source file opened for binary reading
+        fdst: Destination file opened for binary writing
+    """
+    buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+    while True:
+        size = fsrc.readinto(buffer)
+        if not size:
+            break
+        fdst.write(buffer[:size])
+
+
+def copy_file_contents(src: str, dst: str) -> None:
+    """
+    Copy a file with its metadata, keeping the data in the kernel if possible.
+
+    On copy-on-write file systems the file is cloned instead of copied.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    if _copy_file_range is None:
+        shutil.copy2(src, dst)
+        return
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        if not _clone_file(infd, outfd):
+            try:
+                while _copy_file_range(infd, outfd, 1 << 30):
+                    pass
+            except OSError:
+                # Not supported between these file systems, copy in user space
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                _copy_file_object(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def copy_tree(
+    source_path: Union[str, Path],
+    destination_path: Union[str, Path],
+    overwrite: bool = True,
+) -> Path:
+    """
+    Copy a directory tree, merging into an existing destination.
+
+    Behaves like shutil.copytree(..., dirs_exist_ok=True) but copies file
+    contents with os.copy_file_range where available, so page data is not
+    bounced through user space.
+
+    Args:
+        source_path: Source folder path
+        destination_path: Destination folder path
+        overwrite: Whether to replace files that already exist in the
+            destination instead of keeping them
+
+    Returns:
+        Path to the destination folder
+    """
+    os.makedirs(destination_path, exist_ok=True)
+    with os.scandir(source_path) as entries:
+        for entry in entries:
+            target = os.path.join(destination_path, entry.name)
+            if entry.is_dir():
+                copy_tree(entry.path, target, overwrite)
+            elif overwrite or not os.path.exists(target):
+                copy_file_contents(entry.path, target)
+    shutil.copystat(source_path, destination_path)
+    return Path(destination_path)
+
+
+def rename_directory(
+    source_path: Union[str, Path], destination_path: Union[str, Path]
+) -> bool:
+    """
+    Move a directory with a single rename when nothing has to be copied.
+
+    Args:
+        source_path: Source folder path
+        destination_path: Destination folder path, which must not contain files
+
+    Returns:
+        True if the directory was renamed, False if the destination is on
+        another file system or already has content
+    """
+    try:
+        os.rename(source_path, destination_path)
+    except OSError as e:
+        if e.errno in (errno.EXDEV, errno.ENOTEMPTY, errno.EEXIST):
+            return False
+        raise
+    return True
+
+
 class MovableCollection(CollectionPath):
     """
     A collection that can be moved or copied.
@@ -343,14 +480,15 @@ class MovableCollection(CollectionPath):
             CollectionPath to the destination
         """
         # Make sure the destination exists
-        if not new_path.exists():
-            new_path.mkdir(parents=True, mode=0o755)
-
-        # Process each file
-        for file in self.get_files():
-            source_path = file.resolve()
-            destination_path = new_path.joinpath(file.name).resolve()
-            command(source_path, destination_path, self.duplicate_handler)
+        os.makedirs(new_path, mode=0o755, exist_ok=True)
+        destination = str(Path(new_path).resolve())
+
+        # Process each file, the directory entries already know their type
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    destination_path = os.path.join(destination, entry.name)
+                    command(entry.path, destination_path, self.duplicate_handler)
 
         logger.info(f"{command.__name__} from: {self._path} to: {new_path}")
 
@@ -5,13 +5,21 @@ This module provides value objects for working with file paths consistently
 throughout the application, with proper validation and error handling.
 """
 
+import errno
+import os
 import shutil
+import stat
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 from collection_sorter.common.exceptions import FileOperationError
 
+# Errors that mean "no such path", as Path.exists() treats them
+_MISSING_ERRNOS = frozenset(
+    {errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP, errno.ENAMETOOLONG}
+)
+
 
 class PathType(Enum):
     """Types of paths that can be handled."""
@@ -56,8 +64,11 @@ class FilePath:
         # Convert to Path object and normalize
         self._path = Path(path).expanduser().resolve()
 
+        # A single stat answers every validation check below
+        mode = self._stat_mode()
+
         # Handle creation if needed
-        if create_if_missing and not self._path.exists():
+        if create_if_missing and mode is None:
             try:
                 if path_type == PathType.DIRECTORY:
                     self._path.mkdir(parents=True, exist_ok=True)
@@ -68,26 +79,43 @@ class FilePath:
                 raise FileOperationError(
                     f"Failed to create path: {e}", path=str(self._path)
                 )
+            mode = self._stat_mode()
 
         # Validate existence if required
-        if must_exist and not self._path.exists():
+        if must_exist and mode is None:
             raise FileOperationError(
                 f"Path does not exist: {self._path}", path=str(self._path)
             )
 
         # Validate path type if it exists
-        if self._path.exists():
-            if path_type == PathType.FILE and not self._path.is_file():
+        if mode is not None:
+            if path_type == PathType.FILE and not stat.S_ISREG(mode):
                 raise FileOperationError(
                     f"Expected a file but got a directory: {self._path}",
                     path=str(self._path),
                 )
-            elif path_type == PathType.DIRECTORY and not self._path.is_dir():
+            elif path_type == PathType.DIRECTORY and not stat.S_ISDIR(mode):
                 raise FileOperationError(
                     f"Expected a directory but got a file: {self._path}",
                     path=str(self._path),
                 )
 
+    def _stat_mode(self) -> Optional[int]:
+        """
+        Get the file mode of the path, following symlinks.
+
+        Returns:
+            The st_mode of the path, or None if it does not exist
+        """
+        try:
+            return os.stat(self._path).st_mode
+        except OSError as e:
+            if e.errno in _MISSING_ERRNOS:
+                return None
+            raise FileOperationError(
+                f"Cannot access path: {e}", path=str(self._path)
+            ) from e
+
     @property
     def path(self) -> Path:
         """Get the underlying Path object."""
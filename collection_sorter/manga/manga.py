@@ -1,9 +1,14 @@
 import logging
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger("manga")
-brackets = {"(", ")", "[", "]", "{", "}"}
+brackets = frozenset("()[]{}")
+# Any bracket opens a tag and the next bracket of any kind closes it
+_TAG_RE = re.compile(r"[()\[\]{}]([^()\[\]{}]*)[()\[\]{}]")
+_DIGIT_RE = re.compile(r"\d")
+_NAME_RE = re.compile(r"[\w\d_  !~'\\-]+")
 
 
 class MangaParser(object):
@@ -17,40 +22,22 @@ class MangaParser(object):
         Returns:
             List of extracted tag strings
         """
-        tags = list()
-        fi = 0
-        li = 0
-        index = 0
-        last = False
-        first = False
-        for letter in tag_string:
-            if letter in brackets:
-                if not first:
-                    first = True
-                    fi = index
-                else:
-                    last = True
-                    li = index
-            if last:
-                tag = tag_string[fi + 1 : li]
-                tags.append(tag.strip())
-                last = False
-                first = False
-
-            index += 1
-
-        return tags
+        if brackets.isdisjoint(tag_string):
+            return []
+        return [m.group(1).strip() for m in _TAG_RE.finditer(tag_string)]
 
     @staticmethod
     def _extract_author_string(author_data: str) -> Tuple[str, str]:
         group = None
-        result = re.search(r"(.+)\s?_?\((.+)\)", author_data)
-        if result:
-            group = result.group(1).strip()
-            author = result.group(2)
+        # "Group (Author)": the last "(" that has a non-empty group before it
+        # and a non-empty author before the last ")"
+        rp = author_data.rfind(")")
+        lp = author_data.rfind("(", 1, rp - 1) if rp > 2 else -1
+        if lp != -1:
+            group = author_data[:lp].strip()
+            author = author_data[lp + 1 : rp]
             if "," in author:
-                authors = [x.strip() for x in author.split(",")]
-                author = ",".join(authors)
+                author = ",".join(x.strip() for x in author.split(","))
             author = author.strip()
         else:
             author = author_data.strip()
@@ -63,13 +50,10 @@ class MangaParser(object):
     @staticmethod
     def _extract_data(manga_data: str) -> Tuple[str, List[str]]:
         tags = []
-        result = re.search(r"[\w\d_  !~'\\-]+", manga_data)
+        result = _NAME_RE.search(manga_data)
         if result:
-            manga_name = result.group(0)
-            index = manga_data.find(manga_name)
-            tag_string = manga_data[index + len(manga_name) :]
-            tags = MangaParser._extract_tags(tag_string)
-            name = manga_name.strip()
+            tags = MangaParser._extract_tags(manga_data[result.end() :])
+            name = result.group(0).strip()
         else:
             name = manga_data.strip()
 
@@ -77,15 +61,9 @@ class MangaParser(object):
 
     @staticmethod
     def _monthly_manga(name: str) -> str:
-        index = 0
-        find_digit = False
-        for character in name:
-            if character.isdigit():
-                find_digit = True
-                break
-            index += 1
-        if find_digit:
-            author = name[0 : index - 1]
+        digit = _DIGIT_RE.search(name)
+        if digit:
+            author = name[0 : digit.start() - 1]
         else:
             author = name
 
@@ -93,20 +71,36 @@ class MangaParser(object):
 
     @staticmethod
     def parse(filename: str) -> Dict[str, Any]:
-        parsed = {}
-        info_at_start = False
+        """Parse a manga directory or file name into its components.
+
+        Results are cached per name; every call returns a fresh dictionary
+        so callers are free to mutate it.
+
+        Args:
+            filename: Manga directory or file name
+
+        Returns:
+            Dictionary with author, optional group, name and tags
+        """
+        parsed = dict(MangaParser._parse_cached(filename))
+        parsed["tags"] = list(parsed["tags"])
+        return parsed
 
-        info_tag_start = filename.find("(")
-        info_tag_end = filename.find(")")
-        if info_tag_end != -1 and info_tag_start == 0:
-            info_at_start = True
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_cached(filename: str) -> Tuple[Tuple[str, Any], ...]:
+        parsed = {}
 
         author_tag_start = filename.find("[")
-        author_tag_end = filename.find("]")
-        is_found = author_tag_end != -1 and author_tag_start != -1
-        author_at_start = author_tag_start == 0 or (
-            info_at_start and author_tag_start - info_tag_end <= 2
-        )
+        author_tag_end = filename.find("]") if author_tag_start != -1 else -1
+        is_found = author_tag_end != -1
+        author_at_start = author_tag_start == 0
+        if is_found and not author_at_start and filename.startswith("("):
+            # The author block may follow a leading "(info)" tag
+            info_tag_end = filename.find(")")
+            author_at_start = (
+                info_tag_end != -1 and author_tag_start - info_tag_end <= 2
+            )
         if is_found and author_at_start:
             author_data = filename[author_tag_start + 1 : author_tag_end].strip()
             author, group = MangaParser._extract_author_string(author_data)
@@ -118,10 +112,10 @@ class MangaParser(object):
 
         name, tags = MangaParser._extract_data(manga_data)
         parsed["name"] = name
-        parsed["tags"] = tags
+        parsed["tags"] = tuple(tags)
 
         if "author" not in parsed:
             author = MangaParser._monthly_manga(name)
             parsed["author"] = author
 
-        return parsed
+        return tuple(parsed.items())
@@ -1,42 +1,68 @@
 from functools import lru_cache
-from typing import Any, Callable, Dict, Optional
-
-import pycountry
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
 
 
 @lru_cache(maxsize=1)
-def _get_languages():
-    return {lang.name.lower() for lang in pycountry.languages}
+def _get_languages() -> FrozenSet[str]:
+    # Loaded on first use: the CLI imports this module for every command and
+    # importing pycountry alone takes tens of milliseconds
+    import pycountry
 
+    return frozenset(lang.name.casefold() for lang in pycountry.languages)
 
-def manga_template_function(
-    info: Dict[str, Any], symbol_replace_function: Optional[Callable[[str], str]] = None
-) -> str:
-    """Format manga information into a standardized filename.
 
-    Args:
-        info: Dictionary containing manga metadata
-        symbol_replace_function: Optional function to clean up special characters
-
-    Returns:
-        Formatted filename string
-    """
-    author = info["author"]
-    name = " ".join(info["name"].split())
+@lru_cache(maxsize=2048)
+def _format_template(
+    author: str,
+    group: Optional[str],
+    name: str,
+    tags: Tuple[str, ...],
+) -> str:
+    name = " ".join(name.split())
 
     # Build author info section
-    group = info.get("group")
     author_info = f"[{group} ({author})]" if group else f"[{author}]"
 
     # Check for language tag
-    languages = _get_languages()
+    # Intersect in C first; only when a language matched walk the tags to
+    # keep the first one
     language_tag = None
-    if tags := info.get("tags"):
-        language_tag = next((tag for tag in tags if tag.lower() in languages), None)
+    hits = _get_languages().intersection(map(str.casefold, tags))
+    if hits:
+        language_tag = next(tag for tag in tags if tag.casefold() in hits)
 
     # Assemble template
     template = f"{author_info} {name}"
     if language_tag:
         template = f"{template} [{language_tag}]"
 
+    return template
+
+
+def manga_template_function(
+    info: Dict[str, Any],
+    symbol_replace_function: Optional[Callable[[str], str]] = None,
+    *,
+    name: Optional[str] = None,
+) -> str:
+    """Format manga information into a standardized filename.
+
+    The template itself is cached; symbol_replace_function is applied to it
+    on every call.
+
+    Args:
+        info: Dictionary containing manga metadata
+        symbol_replace_function: Optional function to clean up special characters
+        name: Name to use instead of info["name"], so callers formatting
+            several names for one author don't need to copy info
+
+    Returns:
+        Formatted filename string
+    """
+    template = _format_template(
+        info["author"],
+        info.get("group"),
+        info["name"] if name is None else name,
+        tuple(info.get("tags") or ()),
+    )
     return symbol_replace_function(template) if symbol_replace_function else template
@@ -1,32 +1,54 @@
-from collections import namedtuple
+import multiprocessing
+import os
+from collections import defaultdict, namedtuple
 from pathlib import Path
-from typing import Callable, List, Union
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
+try:
+    from tinytag import TinyTag
+except ImportError:
+    TinyTag = None
+
+from collection_sorter.common.exceptions import ProcessingError
 from collection_sorter.files.files import CollectionPath
 
-support_extension = [
-    "mp3",
-    "wma",
-    "flac",
-    ".wav",
-    "mc",
-    "aac",
-    "m4a",
-    "ape",
-    "dsf",
-    "dff",
-]
+support_extension = frozenset(
+    {
+        "mp3",
+        "wma",
+        "flac",
+        "wav",
+        "mc",
+        "aac",
+        "m4a",
+        "ape",
+        "dsf",
+        "dff",
+    }
+)
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_TAG_MIN_FILES = 64
+
+
+def _is_music_name(name: str) -> bool:
+    _, dot, extension = name.rpartition(".")
+    return bool(dot) and extension.lower() in support_extension
 
 
 def has_music_extension(path: Path) -> bool:
-    is_extension = False
-    if path.is_file():
-        name = path.name
-        if "." in name:
-            extension = name.split(".")[1]
-            return extension in support_extension
+    # Check the name first, it needs no stat call
+    return _is_music_name(path.name) and path.is_file()
+
 
-    return is_extension
+def _extract_tag(path: str) -> SimpleNamespace:
+    # Runs in a worker process; copy the tag values so they can be pickled
+    # back without the file handle TinyTag keeps
+    tag = TinyTag.get(path)
+    return SimpleNamespace(
+        **{key: value for key, value in vars(tag).items() if not key.startswith("_")}
+    )
 
 
 MusicFile = namedtuple("MusicFile", ["file", "tag"])
@@ -37,25 +59,32 @@ class MusicCollection(CollectionPath):
     def __init__(self, path: Union[Path, str]) -> None:
         super().__init__(path)
 
-    def get_music(self):
-        all_files = self.collect_all()
-        music = self._filter_by_extension(list(all_files))
-        music_parsed = list()
+    def get_music(self) -> Iterator[Path]:
+        return self.collect_with_filter(_is_music_name)
 
     @classmethod
-    def _filter_by_extension(cls, paths: List[Path]) -> List[Path]:
-        filtered = list(filter(lambda x: has_music_extension(x), paths))
-        return filtered
+    def get_by_tag_value(
+        cls, files: List[Path], func: Callable, processes: Optional[int] = None
+    ) -> Dict[Any, List[Path]]:
+        if TinyTag is None:
+            raise ProcessingError(
+                "tinytag package not installed, cannot read music tags",
+                collection_type="music",
+            )
 
-    @classmethod
-    def get_by_tag_value(cls, files: List[Path], func: Callable):
-        tag_value_map = dict()
-        for file in files:
-            tag = TinyTag.get(str(file))
-            key = func(tag)
-            if key not in tag_value_map:
-                tag_value_map[key] = list()
+        paths = [str(file) for file in files]
+        workers = min(processes or os.cpu_count() or 1, len(paths))
+        if workers <= 1 or len(paths) < PARALLEL_TAG_MIN_FILES:
+            tags = [_extract_tag(path) for path in paths]
+        else:
+            # Tag parsing is CPU bound, so spread it over worker processes,
+            # a few chunks per worker to even out slow files
+            chunksize = max(1, len(paths) // (workers * 4))
+            with multiprocessing.Pool(workers) as pool:
+                tags = pool.map(_extract_tag, paths, chunksize=chunksize)
 
-            tag_value_map[key].append(file)
+        tag_value_map = defaultdict(list)
+        for file, tag in zip(files, tags):
+            tag_value_map[func(tag)].append(file)
 
-        return tag_value_map
+        return dict(tag_value_map)
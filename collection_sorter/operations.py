@@ -5,6 +5,7 @@ This module provides file operations that use the Result pattern
 for better error handling and composability.
 """
 
+import itertools
 import logging
 import os
 import shutil
@@ -12,7 +13,9 @@ import zipfile
 from pathlib import Path
 from typing import Callable, List, Optional, Union
 
+from collection_sorter.files.archive import write_file
 from collection_sorter.files.duplicates import DuplicateHandler, DuplicateStrategy
+from collection_sorter.files.move import copy_file_contents
 from collection_sorter.files.paths import FilePath, PathType
 from collection_sorter.result import (
     ErrorType,
@@ -84,7 +87,10 @@ def list_files(path: Union[str, Path, FilePath]) -> List[Path]:
     if not dir_path.is_dir():
         raise NotADirectoryError(f"Not a directory: {dir_path}")
 
-    return [f for f in dir_path.iterdir() if f.is_file()]
+    # DirEntry carries the file type from the directory read itself, so the
+    # listing costs one getdents pass instead of an extra stat per entry
+    with os.scandir(dir_path) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_file()]
 
 
 @result_handler
@@ -109,7 +115,8 @@ def list_directories(path: Union[str, Path, FilePath]) -> List[Path]:
     if not dir_path.is_dir():
         raise NotADirectoryError(f"Not a directory: {dir_path}")
 
-    return [d for d in dir_path.iterdir() if d.is_dir()]
+    with os.scandir(dir_path) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_dir()]
 
 
 @result_handler
@@ -135,9 +142,6 @@ def move_file(
     src_path = FilePath(source, PathType.FILE).path
     dst_path = FilePath(destination, must_exist=False).path
 
-    # Make sure the destination directory exists
-    dst_path.parent.mkdir(parents=True, exist_ok=True)
-
     # Handle duplicates if the destination exists
     final_dst_path = dst_path
     is_duplicate = False
@@ -152,14 +156,11 @@ def move_file(
             )
         else:
             # Default behavior - rename the destination
-            identifier = "1"
-            counter = 1
-            while final_dst_path.exists():
-                stem = dst_path.stem
-                suffix = dst_path.suffix
-                final_dst_path = dst_path.with_name(f"{stem}_{identifier}{suffix}")
-                counter += 1
-                identifier = str(counter)
+            stem, suffix = dst_path.stem, dst_path.suffix
+            for counter in itertools.count(1):
+                final_dst_path = dst_path.with_name(f"{stem}_{counter}{suffix}")
+                if not final_dst_path.exists():
+                    break
             is_duplicate = True
 
     # If the duplicate strategy is SKIP, don't do anything
@@ -168,17 +169,24 @@ def move_file(
         and duplicate_handler
         and duplicate_handler.strategy == DuplicateStrategy.SKIP
     ):
-        logger.info(f"Skipping duplicate file: {src_path}")
+        logger.info("Skipping duplicate file: %s", src_path)
         return dst_path
 
     # Move the file
     if dry_run:
-        logger.info(f"Would move: {src_path} -> {final_dst_path}")
+        logger.info("Would move: %s -> %s", src_path, final_dst_path)
         return final_dst_path
 
-    # Perform the actual move
-    shutil.move(src_path, final_dst_path)
-    logger.info(f"Moved: {src_path} -> {final_dst_path}")
+    # Make sure the destination directory exists
+    final_dst_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Perform the actual move: a plain rename within one filesystem, with
+    # shutil.move copying across devices or moving into a directory
+    try:
+        os.rename(src_path, final_dst_path)
+    except OSError:
+        shutil.move(src_path, final_dst_path)
+    logger.info("Moved: %s -> %s", src_path, final_dst_path)
     return final_dst_path
 
 
@@ -205,9 +213,6 @@ def copy_file(
     src_path = FilePath(source, PathType.FILE).path
     dst_path = FilePath(destination, must_exist=False).path
 
-    # Make sure the destination directory exists
-    dst_path.parent.mkdir(parents=True, exist_ok=True)
-
     # Handle duplicates if the destination exists
     final_dst_path = dst_path
     is_duplicate = False
@@ -222,14 +227,11 @@ def copy_file(
             )
         else:
             # Default behavior - rename the destination
-            identifier = "1"
-            counter = 1
-            while final_dst_path.exists():
-                stem = dst_path.stem
-                suffix = dst_path.suffix
-                final_dst_path = dst_path.with_name(f"{stem}_{identifier}{suffix}")
-                counter += 1
-                identifier = str(counter)
+            stem, suffix = dst_path.stem, dst_path.suffix
+            for counter in itertools.count(1):
+                final_dst_path = dst_path.with_name(f"{stem}_{counter}{suffix}")
+                if not final_dst_path.exists():
+                    break
             is_duplicate = True
 
     # If the duplicate strategy is SKIP, don't do anything
@@ -238,17 +240,20 @@ def copy_file(
         and duplicate_handler
         and duplicate_handler.strategy == DuplicateStrategy.SKIP
     ):
-        logger.info(f"Skipping duplicate file: {src_path}")
+        logger.info("Skipping duplicate file: %s", src_path)
         return dst_path
 
     # Copy the file
     if dry_run:
-        logger.info(f"Would copy: {src_path} -> {final_dst_path}")
+        logger.info("Would copy: %s -> %s", src_path, final_dst_path)
         return final_dst_path
 
-    # Perform the actual copy
-    shutil.copy2(src_path, final_dst_path)
-    logger.info(f"Copied: {src_path} -> {final_dst_path}")
+    # Make sure the destination directory exists
+    final_dst_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Perform the actual copy, cloning or copying in the kernel where possible
+    copy_file_contents(str(src_path), str(final_dst_path))
+    logger.info("Copied: %s -> %s", src_path, final_dst_path)
     return final_dst_path
 
 
@@ -275,18 +280,14 @@ def rename_file(
     src_path = FilePath(source).path
 
     # Handle new_name as either a name or a full path
-    if isinstance(new_name, (str, Path)) and (
-        "/" not in str(new_name) and "\\" not in str(new_name)
-    ):
+    name = str(new_name)
+    if isinstance(new_name, (str, Path)) and "/" not in name and "\\" not in name:
         # Just a name, not a path
         dst_path = src_path.parent / new_name
     else:
         # Full path
         dst_path = FilePath(new_name, must_exist=False).path
 
-    # Make sure the destination directory exists
-    dst_path.parent.mkdir(parents=True, exist_ok=True)
-
     # Handle duplicates if the destination exists
     final_dst_path = dst_path
     is_duplicate = False
@@ -301,14 +302,11 @@ def rename_file(
             )
         else:
             # Default behavior - rename the destination
-            identifier = "1"
-            counter = 1
-            while final_dst_path.exists() and final_dst_path != src_path:
-                stem = dst_path.stem
-                suffix = dst_path.suffix
-                final_dst_path = dst_path.with_name(f"{stem}_{identifier}{suffix}")
-                counter += 1
-                identifier = str(counter)
+            stem, suffix = dst_path.stem, dst_path.suffix
+            for counter in itertools.count(1):
+                final_dst_path = dst_path.with_name(f"{stem}_{counter}{suffix}")
+                if final_dst_path == src_path or not final_dst_path.exists():
+                    break
             is_duplicate = True
 
     # If the duplicate strategy is SKIP, don't do anything
@@ -317,17 +315,22 @@ def rename_file(
         and duplicate_handler
         and duplicate_handler.strategy == DuplicateStrategy.SKIP
     ):
-        logger.info(f"Skipping rename due to duplicate: {src_path}")
+        logger.info("Skipping rename due to duplicate: %s", src_path)
         return src_path
 
     # Rename the file
     if dry_run:
-        logger.info(f"Would rename: {src_path} -> {final_dst_path}")
+        logger.info("Would rename: %s -> %s", src_path, final_dst_path)
         return final_dst_path
 
+    # Make sure the destination directory exists; a rename within the
+    # source directory, the usual case, needs no mkdir
+    if final_dst_path.parent != src_path.parent:
+        final_dst_path.parent.mkdir(parents=True, exist_ok=True)
+
     # Perform the actual rename
     os.rename(src_path, final_dst_path)
-    logger.info(f"Renamed: {src_path} -> {final_dst_path}")
+    logger.info("Renamed: %s -> %s", src_path, final_dst_path)
     return final_dst_path
 
 
@@ -339,6 +342,7 @@ def archive_directory(
     compression_level: int = 6,
     duplicate_handler: Optional[DuplicateHandler] = None,
     dry_run: bool = False,
+    directories: Optional[List[Union[str, Path]]] = None,
 ) -> Path:
     """
     Archive a directory to a ZIP file with result-based error handling.
@@ -350,6 +354,8 @@ def archive_directory(
         compression_level: ZIP compression level (0-9)
         duplicate_handler: Optional handler for duplicates
         dry_run: Whether to simulate operations without making changes
+        directories: Only archive these directories of the source, each as
+            a top-level folder; archive_name then only names the file
 
     Returns:
         Path to the created archive
@@ -385,16 +391,11 @@ def archive_directory(
             )
         else:
             # Default behavior - rename the destination
-            identifier = "1"
-            counter = 1
-            while final_archive_path.exists():
-                stem = archive_path.stem
-                suffix = archive_path.suffix
-                final_archive_path = archive_path.with_name(
-                    f"{stem}_{identifier}{suffix}"
-                )
-                counter += 1
-                identifier = str(counter)
+            stem, suffix = archive_path.stem, archive_path.suffix
+            for counter in itertools.count(1):
+                final_archive_path = archive_path.with_name(f"{stem}_{counter}{suffix}")
+                if not final_archive_path.exists():
+                    break
             is_duplicate = True
 
     # If the duplicate strategy is SKIP, don't do anything
@@ -403,12 +404,12 @@ def archive_directory(
         and duplicate_handler
         and duplicate_handler.strategy == DuplicateStrategy.SKIP
     ):
-        logger.info(f"Skipping duplicate archive: {archive_path}")
+        logger.info("Skipping duplicate archive: %s", archive_path)
         return archive_path
 
     # Archive the directory
     if dry_run:
-        logger.info(f"Would archive directory: {src_path} -> {final_archive_path}")
+        logger.info("Would archive directory: %s -> %s", src_path, final_archive_path)
         return final_archive_path
 
     # Make sure the parent directory exists
@@ -421,22 +422,25 @@ def archive_directory(
         compression=zipfile.ZIP_DEFLATED,
         compresslevel=compression_level,
     ) as zf:
+        # Pair each directory to walk with its root folder in the archive
+        if directories is None:
+            # Use custom name as root in archive, or the directory's own name
+            roots = [(src_path, archive_name or src_path.name)]
+        else:
+            roots = [(Path(path), Path(path).name) for path in directories]
+
         # Add files to the archive
-        for root, dirs, files in os.walk(src_path):
-            root_path = Path(root)
-            for file in files:
-                file_path = root_path / file
-                # Calculate the path within the archive
-                if archive_name:
-                    # Use custom name as root in archive
-                    rel_path = Path(archive_name) / file_path.relative_to(src_path)
-                else:
-                    # Use original directory structure
-                    rel_path = file_path.relative_to(src_path.parent)
-                # Add to archive
-                zf.write(file_path, rel_path)
-
-    logger.info(f"Archived directory: {src_path} -> {final_archive_path}")
+        for directory, arc_root in roots:
+            for root, dirs, files in os.walk(directory):
+                root_path = Path(root)
+                for file in files:
+                    file_path = root_path / file
+                    # Calculate the path within the archive
+                    rel_path = Path(arc_root, file_path.relative_to(directory))
+                    # Add to archive, storing already compressed media as is
+                    write_file(zf, file_path, rel_path)
+
+    logger.info("Archived directory: %s -> %s", src_path, final_archive_path)
     return final_archive_path
 
 
@@ -493,12 +497,10 @@ def extract_archive(
             )
         else:
             # Default behavior - rename the destination
-            identifier = "1"
-            counter = 1
-            while final_dest_dir.exists():
-                final_dest_dir = dest_dir.parent / f"{dest_dir.name}_{identifier}"
-                counter += 1
-                identifier = str(counter)
+            for counter in itertools.count(1):
+                final_dest_dir = dest_dir.parent / f"{dest_dir.name}_{counter}"
+                if not final_dest_dir.exists():
+                    break
             is_duplicate = True
 
     # If the duplicate strategy is SKIP, don't do anything
@@ -507,12 +509,12 @@ def extract_archive(
         and duplicate_handler
         and duplicate_handler.strategy == DuplicateStrategy.SKIP
     ):
-        logger.info(f"Skipping extraction to existing directory: {dest_dir}")
+        logger.info("Skipping extraction to existing directory: %s", dest_dir)
         return dest_dir
 
     # Extract the archive
     if dry_run:
-        logger.info(f"Would extract archive: {src_path} -> {final_dest_dir}")
+        logger.info("Would extract archive: %s -> %s", src_path, final_dest_dir)
         return final_dest_dir
 
     # Make sure the destination directory exists
@@ -522,7 +524,7 @@ def extract_archive(
     with zipfile.ZipFile(src_path) as zf:
         zf.extractall(final_dest_dir)
 
-    logger.info(f"Extracted archive: {src_path} -> {final_dest_dir}")
+    logger.info("Extracted archive: %s -> %s", src_path, final_dest_dir)
     return final_dest_dir
 
 
@@ -543,12 +545,12 @@ def delete_file(path: Union[str, Path, FilePath], dry_run: bool = False) -> Path
 
     # Delete the file
     if dry_run:
-        logger.info(f"Would delete file: {file_path}")
+        logger.info("Would delete file: %s", file_path)
         return file_path
 
     # Perform the actual deletion
     os.unlink(file_path)
-    logger.info(f"Deleted file: {file_path}")
+    logger.info("Deleted file: %s", file_path)
     return file_path
 
 
@@ -572,7 +574,7 @@ def delete_directory(
 
     # Delete the directory
     if dry_run:
-        logger.info(f"Would delete directory: {dir_path}")
+        logger.info("Would delete directory: %s", dir_path)
         return dir_path
 
     # Perform the actual deletion
@@ -581,7 +583,7 @@ def delete_directory(
     else:
         os.rmdir(dir_path)
 
-    logger.info(f"Deleted directory: {dir_path}")
+    logger.info("Deleted directory: %s", dir_path)
     return dir_path
 
 
@@ -635,20 +637,18 @@ def move_and_rename(
     Returns:
         Result with path to the renamed file or error
     """
-    # Move the file to the destination
-    move_result = move_file(
-        source, destination, duplicate_handler=duplicate_handler, dry_run=dry_run
-    )
-
-    if move_result.is_failure():
-        return move_result
-
-    # Get the moved file path
-    moved_path = move_result.unwrap()
+    # Move straight to the new name: one rename instead of a move followed
+    # by a rename, with duplicates resolved against the final name
+    if isinstance(destination, FilePath):
+        dest_dir = destination.path
+    else:
+        dest_dir = Path(destination)
 
-    # Rename the file
-    return rename_file(
-        moved_path, new_name, duplicate_handler=duplicate_handler, dry_run=dry_run
+    return move_file(
+        source,
+        dest_dir / new_name,
+        duplicate_handler=duplicate_handler,
+        dry_run=dry_run,
     )
 
 
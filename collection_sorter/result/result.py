@@ -13,7 +13,18 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
 T = TypeVar("T")  # Success type
 E = TypeVar("E")  # Error type
@@ -34,6 +45,9 @@ class Result(Generic[T, E], ABC):
     or a failed operation with an error of type E.
     """
 
+    # One result is created per file operation; slots keep them dict-free
+    __slots__ = ()
+
     @abstractmethod
     def is_success(self) -> bool:
         """Check if this result is a success."""
@@ -187,12 +201,12 @@ class Result(Generic[T, E], ABC):
             return Result.failure(e)
 
     @staticmethod
-    def collect(results: List[Result[T, E]]) -> Result[List[T], List[E]]:
+    def collect(results: Iterable[Result[T, E]]) -> Result[List[T], List[E]]:
         """
-        Collect a list of results into a single result.
+        Collect results into a single result.
 
         Args:
-            results: List of results to collect
+            results: Results to collect, consumed in a single pass
 
         Returns:
             Success with list of success values if all results are success,
@@ -216,6 +230,8 @@ class Result(Generic[T, E], ABC):
 class Success(Result[T, Any]):
     """Success variant of Result, containing a value."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: T):
         """
         Initialize a success result.
@@ -320,6 +336,8 @@ class Success(Result[T, Any]):
 class Failure(Result[Any, E]):
     """Failure variant of Result, containing an error."""
 
+    __slots__ = ("_error",)
+
     def __init__(self, error: E):
         """
         Initialize a failure result.
@@ -6,8 +6,11 @@ and the Result pattern for better error handling and composability.
 """
 
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from collection_sorter.files import FilePath
 from collection_sorter.files.duplicates import DuplicateHandler
@@ -29,6 +32,10 @@ from .result import BoolResult, OperationError, PathResult, Result
 
 logger = logging.getLogger("result_processor")
 
+# Coarsest directory timestamp resolution we expect (FAT and some network
+# filesystems); listings of directories changed more recently are not cached
+MTIME_GRANULARITY_NS = 2_000_000_000
+
 
 class ResultFileProcessor:
     """
@@ -63,9 +70,14 @@ class ResultFileProcessor:
             duplicate_handler=duplicate_handler,
         )
 
-        # Create the context with a default strategy
+        # Create the context with a default strategy. The named operations
+        # below call their strategy directly and leave the context alone, so
+        # they are safe to run from several threads at once
         self.context = ResultFileOperationContext(self.strategies["move_file"])
 
+        # Directory listings keyed by (path, kind), with the directory mtime
+        self._listings: Dict[Tuple[str, str], Tuple[int, List[Path]]] = {}
+
     def set_strategy(self, operation: str) -> None:
         """
         Set the current strategy by name.
@@ -127,7 +139,7 @@ class ResultFileProcessor:
         Returns:
             Result with list of file paths or error
         """
-        return list_files(path)
+        return self._cached_listing(path, "files", list_files)
 
     def list_directories(
         self, path: Union[str, Path, FilePath]
@@ -141,7 +153,47 @@ class ResultFileProcessor:
         Returns:
             Result with list of directory paths or error
         """
-        return list_directories(path)
+        return self._cached_listing(path, "directories", list_directories)
+
+    def _cached_listing(
+        self,
+        path: Union[str, Path, FilePath],
+        kind: str,
+        lister: Callable[..., Result[List[Path], OperationError]],
+    ) -> Result[List[Path], OperationError]:
+        """
+        Return a directory listing, reusing the last one while it is current.
+
+        Adding, removing or renaming an entry updates the directory mtime,
+        so a listing is reused only while the mtime is unchanged. Entries
+        added within one timestamp tick leave the mtime as it was, so
+        directories modified within MTIME_GRANULARITY_NS of now are listed
+        again every time. Failed listings are never cached.
+
+        Args:
+            path: Directory path
+            kind: Kind of entries listed, part of the cache key
+            lister: Operation producing the listing
+
+        Returns:
+            Result with list of paths or error
+        """
+        dir_path = path.path if isinstance(path, FilePath) else Path(path)
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            # Let the operation report the error
+            return lister(path)
+
+        key = (os.path.abspath(dir_path), kind)
+        cached = self._listings.get(key)
+        if cached is not None and cached[0] == mtime:
+            return Result.success(list(cached[1]))
+
+        result = lister(path)
+        if result.is_success() and time.time_ns() - mtime >= MTIME_GRANULARITY_NS:
+            self._listings[key] = (mtime, list(result.unwrap()))
+        return result
 
     def move_file(
         self,
@@ -158,8 +210,7 @@ class ResultFileProcessor:
         Returns:
             Result with path to the destination file or error
         """
-        self.set_strategy("move_file")
-        return self.context.execute(source, destination)
+        return self.strategies["move_file"].execute(source, destination)
 
     def copy_file(
         self,
@@ -176,8 +227,7 @@ class ResultFileProcessor:
         Returns:
             Result with path to the destination file or error
         """
-        self.set_strategy("copy_file")
-        return self.context.execute(source, destination)
+        return self.strategies["copy_file"].execute(source, destination)
 
     def rename_file(
         self, source: Union[str, Path, FilePath], new_name: Union[str, Path, FilePath]
@@ -192,8 +242,7 @@ class ResultFileProcessor:
         Returns:
             Result with path to the renamed file or error
         """
-        self.set_strategy("rename_file")
-        return self.context.execute(source, new_name)
+        return self.strategies["rename_file"].execute(source, new_name)
 
     def archive_directory(
         self,
@@ -212,8 +261,7 @@ class ResultFileProcessor:
         Returns:
             Result with path to the created archive or error
         """
-        self.set_strategy("archive")
-        return self.context.execute(source, destination, archive_name)
+        return self.strategies["archive"].execute(source, destination, archive_name)
 
     def extract_archive(
         self,
@@ -230,8 +278,7 @@ class ResultFileProcessor:
         Returns:
             Result with path to the extraction directory or error
         """
-        self.set_strategy("extract_archive")
-        return self.context.execute(source, destination)
+        return self.strategies["extract_archive"].execute(source, destination)
 
     def delete_file(self, path: Union[str, Path, FilePath]) -> PathResult:
         """
@@ -243,8 +290,7 @@ class ResultFileProcessor:
         Returns:
             Result with path to the deleted file or error
         """
-        self.set_strategy("delete_file")
-        return self.context.execute(path)
+        return self.strategies["delete_file"].execute(path)
 
     def delete_directory(self, path: Union[str, Path, FilePath]) -> PathResult:
         """
@@ -256,8 +302,7 @@ class ResultFileProcessor:
         Returns:
             Result with path to the deleted directory or error
         """
-        self.set_strategy("delete_directory")
-        return self.context.execute(path)
+        return self.strategies["delete_directory"].execute(path)
 
     def move_and_rename(
         self,
@@ -310,11 +355,124 @@ class ResultFileProcessor:
             dry_run=self.dry_run,
         )
 
+    def _run_operation(
+        self,
+        items: List[Path],
+        operation: Callable[..., PathResult],
+        max_workers: int,
+        *args,
+        **kwargs,
+    ) -> Iterator[PathResult]:
+        """
+        Apply an operation to each item, optionally on a thread pool.
+
+        Results are yielded as they are consumed, so collecting them never
+        holds a full list of intermediate results.
+
+        Args:
+            items: Paths to process
+            operation: Operation function to apply to each item
+            max_workers: Number of items processed in parallel
+            *args: Additional positional arguments for the operation
+            **kwargs: Additional keyword arguments for the operation
+
+        Yields:
+            Operation results, in item order
+        """
+        workers = min(max_workers, len(items))
+        if workers <= 1:
+            for item in items:
+                yield operation(item, *args, **kwargs)
+            return
+
+        # Operations report failures as results, so every item runs to
+        # completion and errors are collected just like the serial path
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(
+                lambda item: operation(item, *args, **kwargs), items
+            )
+
+    def _into_directory(
+        self, name: str, destination: Union[str, Path, FilePath]
+    ) -> Callable[[Path], PathResult]:
+        """
+        Bind a file strategy to targets inside a destination directory.
+
+        Every file keeps its name, so files processed in parallel never
+        compete for the same destination path. The directory is created
+        once here, so each file finds it already in place.
+
+        Args:
+            name: Name of a strategy taking a source and a destination file
+            destination: Destination directory
+
+        Returns:
+            Operation taking only the source file
+        """
+        execute = self.strategies[name].execute
+        if isinstance(destination, FilePath):
+            dest_dir = destination.path
+        else:
+            dest_dir = Path(destination)
+
+        # If the directory cannot be created, every file reports the error
+        if not self.dry_run:
+            ensure_directory(dest_dir)
+        return lambda file: execute(file, dest_dir / file.name)
+
+    def _list_collection(
+        self, source: Union[str, Path, FilePath]
+    ) -> Result[List[Path], OperationError]:
+        """
+        List the files of a collection, or the source itself if it is a file.
+
+        Args:
+            source: Source directory or file
+
+        Returns:
+            Result with list of file paths or error
+        """
+        if isinstance(source, (str, Path)) and Path(source).is_file():
+            return Result.success([Path(source)])
+        return self.list_files(source)
+
+    def _bulk_into_directory(
+        self,
+        name: str,
+        source: Union[str, Path, FilePath],
+        destination: Union[str, Path, FilePath],
+        max_workers: int,
+    ) -> Result[List[Path], List[OperationError]]:
+        """
+        Apply a file strategy to every file of a collection, into one directory.
+
+        The destination is only prepared once the source has been listed, so
+        an invalid source leaves nothing behind.
+
+        Args:
+            name: Name of a strategy taking a source and a destination file
+            source: Source directory or file
+            destination: Destination directory
+            max_workers: Number of files processed in parallel
+
+        Returns:
+            Result with list of destination paths or list of errors
+        """
+        files_result = self._list_collection(source)
+        if files_result.is_failure():
+            return Result.failure([files_result.error()])
+
+        operation = self._into_directory(name, destination)
+        return Result.collect(
+            self._run_operation(files_result.unwrap(), operation, max_workers)
+        )
+
     def process_collection(
         self,
         source: Union[str, Path, FilePath],
         operation: Callable[[Union[str, Path, FilePath], ...], PathResult],
         *args,
+        max_workers: int = 1,
         **kwargs,
     ) -> Result[List[Path], List[OperationError]]:
         """
@@ -324,25 +482,22 @@ class ResultFileProcessor:
             source: Source directory or file
             operation: Operation function to apply to each file
             *args: Additional positional arguments for the operation
+            max_workers: Number of files processed in parallel
             **kwargs: Additional keyword arguments for the operation
 
         Returns:
             Result with list of operation results or list of errors
         """
         # List files in the source
-        if isinstance(source, (str, Path)) and Path(source).is_file():
-            files_result = Result.success([Path(source)])
-        else:
-            files_result = self.list_files(source)
+        files_result = self._list_collection(source)
 
         if files_result.is_failure():
             return Result.failure([files_result.error()])
 
         # Process each file
-        results = []
-        for file in files_result.unwrap():
-            result = operation(file, *args, **kwargs)
-            results.append(result)
+        results = self._run_operation(
+            files_result.unwrap(), operation, max_workers, *args, **kwargs
+        )
 
         # Collect all results
         return Result.collect(results)
@@ -351,6 +506,7 @@ class ResultFileProcessor:
         self,
         source: Union[str, Path, FilePath],
         destination: Union[str, Path, FilePath],
+        max_workers: int = 1,
     ) -> Result[List[Path], List[OperationError]]:
         """
         Move all files in a collection to a new location.
@@ -358,16 +514,18 @@ class ResultFileProcessor:
         Args:
             source: Source directory or file
             destination: Destination directory
+            max_workers: Number of files moved in parallel
 
         Returns:
             Result with list of destination paths or list of errors
         """
-        return self.process_collection(source, self.move_file, destination)
+        return self._bulk_into_directory("move_file", source, destination, max_workers)
 
     def bulk_copy(
         self,
         source: Union[str, Path, FilePath],
         destination: Union[str, Path, FilePath],
+        max_workers: int = 1,
     ) -> Result[List[Path], List[OperationError]]:
         """
         Copy all files in a collection to a new location.
@@ -375,16 +533,19 @@ class ResultFileProcessor:
         Args:
             source: Source directory or file
             destination: Destination directory
+            max_workers: Number of files copied in parallel
 
         Returns:
             Result with list of destination paths or list of errors
         """
-        return self.process_collection(source, self.copy_file, destination)
+        return self._bulk_into_directory("copy_file", source, destination, max_workers)
 
     def bulk_archive(
         self,
         source: Union[str, Path, FilePath],
         destination: Optional[Union[str, Path, FilePath]] = None,
+        max_workers: int = 1,
+        fuse: bool = False,
     ) -> Result[List[Path], List[OperationError]]:
         """
         Archive all directories in a collection.
@@ -392,6 +553,11 @@ class ResultFileProcessor:
         Args:
             source: Source directory
             destination: Optional destination for archives
+            max_workers: Number of directories archived in parallel
+            fuse: Write the same directories into a single archive named
+                after the source, each as a top-level folder, instead of one
+                archive per directory; the archive strategy then receives
+                them through its directories keyword
 
         Returns:
             Result with list of archive paths or list of errors
@@ -402,11 +568,24 @@ class ResultFileProcessor:
         if directories_result.is_failure():
             return Result.failure([directories_result.error()])
 
+        if fuse:
+            directories = directories_result.unwrap()
+            if not directories:
+                return Result.success([])
+
+            # One ZipFile and one output file for the whole collection
+            result = self.strategies["archive"].execute(
+                source, destination, directories=directories
+            )
+            return Result.collect([result])
+
         # Archive each directory
-        results = []
-        for directory in directories_result.unwrap():
-            result = self.archive_directory(directory, destination)
-            results.append(result)
+        results = self._run_operation(
+            directories_result.unwrap(),
+            self.archive_directory,
+            max_workers,
+            destination,
+        )
 
         # Collect all results
         return Result.collect(results)
@@ -440,7 +619,7 @@ class ResultFileProcessor:
         error = result.error()
 
         if log_error:
-            logger.error(f"Operation failed: {error}")
+            logger.error("Operation failed: %s", error)
 
         if raise_exception:
             from collection_sorter.common.exceptions import FileOperationError
@@ -8,7 +8,7 @@ Result pattern for better error handling and composability.
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from collection_sorter.files import FilePath
 from collection_sorter.files.duplicates import DuplicateHandler
@@ -222,6 +222,7 @@ class ArchiveResultStrategy(ResultFileOperationStrategy):
         source: Union[str, Path, FilePath],
         destination: Optional[Union[str, Path, FilePath]] = None,
         archive_name: Optional[str] = None,
+        directories: Optional[List[Path]] = None,
     ) -> PathResult:
         """
         Archive a directory to a ZIP file.
@@ -230,6 +231,8 @@ class ArchiveResultStrategy(ResultFileOperationStrategy):
             source: Source directory to archive
             destination: Optional destination for the archive
             archive_name: Optional name for the archive
+            directories: Only archive these directories of the source, each
+                as a top-level folder of the one archive
 
         Returns:
             Result with path to the created archive or error
@@ -241,6 +244,7 @@ class ArchiveResultStrategy(ResultFileOperationStrategy):
             compression_level=self.compression_level,
             duplicate_handler=self.duplicate_handler,
             dry_run=self.dry_run,
+            directories=directories,
         )
 
 
@@ -6,19 +6,58 @@ allowing different operation types to be encapsulated as interchangeable
 strategy objects that can be selected at runtime.
 """
 
+import errno
+import itertools
 import logging
+import os
 import shutil
 import zipfile
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from collection_sorter.common.exceptions import FileOperationError
 from collection_sorter.files import FilePath, PathType
+from collection_sorter.files.archive import compress_type, write_file
 from collection_sorter.files.duplicates import DuplicateHandler, DuplicateStrategy
+from collection_sorter.files.move import copy_file_contents
 
 logger = logging.getLogger("strategies")
 
+# Largest file read ahead into memory when archiving with several workers
+PREFETCH_SIZE_LIMIT = 8 << 20
+
+
+def _next_free_name(parent: Path, stem: str, suffix: str) -> Path:
+    """
+    Find the first free ``<stem>_<n><suffix>`` name in a directory.
+
+    The directory is listed once instead of checking each candidate in turn,
+    which matters when many numbered copies already exist.
+
+    Args:
+        parent: Directory the name must be free in
+        stem: Name without the suffix
+        suffix: Suffix to keep after the number, may be empty
+
+    Returns:
+        Path to the first candidate that does not exist
+    """
+    try:
+        with os.scandir(parent) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        existing = set()
+
+    for counter in itertools.count(1):
+        candidate = parent / f"{stem}_{counter}{suffix}"
+        # lexists also catches names differing only in case on
+        # case-insensitive file systems
+        if candidate.name not in existing and not os.path.lexists(candidate):
+            return candidate
+
 
 class FileOperationStrategy(ABC):
     """
@@ -27,6 +66,9 @@ class FileOperationStrategy(ABC):
     This defines the interface that all file operation strategies must implement.
     """
 
+    dry_run: bool = False
+    duplicate_handler: Optional[DuplicateHandler] = None
+
     @abstractmethod
     def execute(self, *args, **kwargs) -> Any:
         """
@@ -47,6 +89,59 @@ class FileOperationStrategy(ABC):
         """Get the name of this strategy."""
         pass
 
+    def _resolve_destination(
+        self, path: FilePath, context: str, directory: bool = False
+    ) -> Tuple[FilePath, bool]:
+        """
+        Choose where to write when the destination may already exist.
+
+        Existing destinations go through the duplicate handler, or get the
+        first free numbered name when there is none.
+
+        Args:
+            path: Intended destination
+            context: Description of the operation for the duplicate handler
+            directory: Whether the destination is a directory to create
+
+        Returns:
+            The destination to use, and whether the operation should be skipped
+        """
+        if not path.exists:
+            return path, False
+
+        if directory:
+            path_type, kwargs = PathType.DIRECTORY, {"create_if_missing": True}
+        else:
+            path_type, kwargs = PathType.ANY, {}
+
+        if self.duplicate_handler:
+            final_path, is_duplicate = self.duplicate_handler.handle_duplicate(
+                path.path,
+                path.path,  # Existing path is the same as new path
+                context=context,
+            )
+            if (
+                is_duplicate
+                and self.duplicate_handler.strategy == DuplicateStrategy.SKIP
+            ):
+                return path, True
+        elif directory:
+            final_path = _next_free_name(path.path.parent, path.name, "")
+        else:
+            final_path = _next_free_name(path.path.parent, path.stem, path.suffix)
+
+        return FilePath(final_path, path_type, must_exist=False, **kwargs), False
+
+    def _ensure_duplicates_dir(self) -> None:
+        """Create the duplicates directory for MOVE_TO_DUPLICATES if needed."""
+        if (
+            not self.dry_run
+            and self.duplicate_handler
+            and self.duplicate_handler.strategy == DuplicateStrategy.MOVE_TO_DUPLICATES
+            and self.duplicate_handler.duplicates_dir
+        ):
+            self.duplicate_handler.duplicates_dir.mkdir(parents=True, exist_ok=True)
+
 
 class MoveFileStrategy(FileOperationStrategy):
     """Strategy for moving a file to a new location."""
@@ -93,63 +188,30 @@ class MoveFileStrategy(FileOperationStrategy):
         dst_path = FilePath(destination, must_exist=False)
 
         # Make sure the parent directory exists
-        dst_path.parent.path.mkdir(parents=True, exist_ok=True)
+        dst_path.path.parent.mkdir(parents=True, exist_ok=True)
 
         # Handle duplicates if the destination exists
-        final_dst_path = dst_path
-        is_duplicate = False
-
-        if dst_path.exists:
-            if self.duplicate_handler:
-                # Use the duplicate handler
-                final_dst_path, is_duplicate = self.duplicate_handler.handle_duplicate(
-                    dst_path.path,
-                    dst_path.path,  # Existing path is the same as new path
-                    context=f"Moving {src_path}",
-                )
-                final_dst_path = FilePath(final_dst_path, must_exist=False)
-            else:
-                # Default behavior - rename the destination
-                identifier = "1"
-                counter = 1
-                while final_dst_path.exists:
-                    stem = dst_path.stem
-                    suffix = dst_path.suffix
-                    final_dst_path = FilePath(
-                        dst_path.path.with_name(f"{stem}_{identifier}{suffix}"),
-                        must_exist=False,
-                    )
-                    counter += 1
-                    identifier = str(counter)
-                is_duplicate = True
+        final_dst_path, skip = self._resolve_destination(dst_path, f"Moving {src_path}")
 
         # If the duplicate strategy is SKIP, don't do anything
-        if (
-            is_duplicate
-            and self.duplicate_handler
-            and self.duplicate_handler.strategy == DuplicateStrategy.SKIP
-        ):
+        if skip:
             logger.info(f"Skipping duplicate file: {src_path}")
             return FilePath(dst_path.path)
 
         # Move the file
         try:
-            # Check if we're using MOVE_TO_DUPLICATES strategy
-            if (
-                self.duplicate_handler
-                and self.duplicate_handler.strategy
-                == DuplicateStrategy.MOVE_TO_DUPLICATES
-                and self.duplicate_handler.duplicates_dir
-            ):
-                # Create the duplicates directory if needed
-                if not self.dry_run:
-                    self.duplicate_handler.duplicates_dir.mkdir(
-                        parents=True, exist_ok=True
-                    )
+            # Create the duplicates directory for MOVE_TO_DUPLICATES
+            self._ensure_duplicates_dir()
 
-            # Perform the actual move
+            # Perform the actual move: one rename within a filesystem, with
+            # shutil.move copying only across devices
             if not self.dry_run:
-                shutil.move(src_path.path, final_dst_path.path)
+                try:
+                    os.replace(src_path.path, final_dst_path.path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(src_path.path, final_dst_path.path)
                 logger.info(f"Moved: {src_path} -> {final_dst_path}")
             else:
                 logger.info(f"Would move: {src_path} -> {final_dst_path}")
@@ -207,63 +269,26 @@ class CopyFileStrategy(FileOperationStrategy):
         dst_path = FilePath(destination, must_exist=False)
 
         # Make sure the parent directory exists
-        dst_path.parent.path.mkdir(parents=True, exist_ok=True)
+        dst_path.path.parent.mkdir(parents=True, exist_ok=True)
 
         # Handle duplicates if the destination exists
-        final_dst_path = dst_path
-        is_duplicate = False
-
-        if dst_path.exists:
-            if self.duplicate_handler:
-                # Use the duplicate handler
-                final_dst_path, is_duplicate = self.duplicate_handler.handle_duplicate(
-                    dst_path.path,
-                    dst_path.path,  # Existing path is the same as new path
-                    context=f"Copying {src_path}",
-                )
-                final_dst_path = FilePath(final_dst_path, must_exist=False)
-            else:
-                # Default behavior - rename the destination
-                identifier = "1"
-                counter = 1
-                while final_dst_path.exists:
-                    stem = dst_path.stem
-                    suffix = dst_path.suffix
-                    final_dst_path = FilePath(
-                        dst_path.path.with_name(f"{stem}_{identifier}{suffix}"),
-                        must_exist=False,
-                    )
-                    counter += 1
-                    identifier = str(counter)
-                is_duplicate = True
+        final_dst_path, skip = self._resolve_destination(
+            dst_path, f"Copying {src_path}"
+        )
 
         # If the duplicate strategy is SKIP, don't do anything
-        if (
-            is_duplicate
-            and self.duplicate_handler
-            and self.duplicate_handler.strategy == DuplicateStrategy.SKIP
-        ):
+        if skip:
             logger.info(f"Skipping duplicate file: {src_path}")
             return FilePath(dst_path.path)
 
         # Copy the file
         try:
-            # Check if we're using MOVE_TO_DUPLICATES strategy
-            if (
-                self.duplicate_handler
-                and self.duplicate_handler.strategy
-                == DuplicateStrategy.MOVE_TO_DUPLICATES
-                and self.duplicate_handler.duplicates_dir
-            ):
-                # Create the duplicates directory if needed
-                if not self.dry_run:
-                    self.duplicate_handler.duplicates_dir.mkdir(
-                        parents=True, exist_ok=True
-                    )
+            # Create the duplicates directory for MOVE_TO_DUPLICATES
+            self._ensure_duplicates_dir()
 
             # Perform the actual copy
             if not self.dry_run:
-                shutil.copy2(src_path.path, final_dst_path.path)
+                copy_file_contents(str(src_path.path), str(final_dst_path.path))
                 logger.info(f"Copied: {src_path} -> {final_dst_path}")
             else:
                 logger.info(f"Would copy: {src_path} -> {final_dst_path}")
@@ -284,6 +309,7 @@ class ArchiveStrategy(FileOperationStrategy):
         compression_level: int = 6,
         dry_run: bool = False,
         duplicate_handler: Optional[DuplicateHandler] = None,
+        max_workers: int = 1,
     ):
         """
         Initialize the strategy.
@@ -292,16 +318,75 @@ class ArchiveStrategy(FileOperationStrategy):
             compression_level: ZIP compression level (0-9)
             dry_run: Whether to simulate operations without making changes
             duplicate_handler: Optional handler for duplicates
+            max_workers: Number of threads reading files ahead of the writer
         """
         self.compression_level = compression_level
         self.dry_run = dry_run
         self.duplicate_handler = duplicate_handler
+        self.max_workers = max_workers
 
     @property
     def name(self) -> str:
         """Get the name of this strategy."""
         return "Archive"
 
+    @staticmethod
+    def _read_small_file(path: Path) -> Optional[bytes]:
+        """
+        Read a file for the archive writer unless it is too large to buffer.
+
+        Args:
+            path: File to read
+
+        Returns:
+            File contents, or None for files over PREFETCH_SIZE_LIMIT
+        """
+        if path.stat().st_size > PREFETCH_SIZE_LIMIT:
+            return None
+        return path.read_bytes()
+
+    def _write_prefetched(
+        self, zf: zipfile.ZipFile, entries: List[Tuple[Path, Path]]
+    ) -> None:
+        """
+        Write files to an archive while worker threads read the next ones.
+
+        Reads run concurrently but the archive is still written by this
+        thread in entry order, since ZipFile writes are not thread-safe.
+        At most two files per worker are held in memory at a time.
+
+        Args:
+            zf: Archive open for writing
+            entries: Pairs of source file and name within the archive
+        """
+        window = self.max_workers * 2
+        pending: "deque[Tuple[Path, Path, Future]]" = deque()
+
+        def write_next() -> None:
+            path, arcname, future = pending.popleft()
+            data = future.result()
+            if data is None:
+                # Large files are streamed instead of held in memory
+                write_file(zf, path, arcname)
+                return
+            method = compress_type(path.name)
+            zinfo = zipfile.ZipInfo.from_file(path, arcname)
+            zf.writestr(
+                zinfo,
+                data,
+                compress_type=zf.compression if method is None else method,
+                compresslevel=zf.compresslevel,
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for path, arcname in entries:
+                future = executor.submit(self._read_small_file, path)
+                pending.append((path, arcname, future))
+                if len(pending) >= window:
+                    write_next()
+            while pending:
+                write_next()
+
     def execute(
         self,
         source: Union[str, Path, FilePath],
@@ -337,39 +422,12 @@ class ArchiveStrategy(FileOperationStrategy):
             archive_path = dest_dir.join(archive_filename)
 
         # Handle duplicates if the destination exists
-        final_archive_path = archive_path
-        is_duplicate = False
-
-        if archive_path.exists:
-            if self.duplicate_handler:
-                # Use the duplicate handler
-                final_path, is_duplicate = self.duplicate_handler.handle_duplicate(
-                    archive_path.path,
-                    archive_path.path,  # Existing path is the same as new path
-                    context=f"Creating archive for {src_path}",
-                )
-                final_archive_path = FilePath(final_path, must_exist=False)
-            else:
-                # Default behavior - rename the destination
-                identifier = "1"
-                counter = 1
-                while final_archive_path.exists:
-                    stem = archive_path.stem
-                    suffix = archive_path.suffix
-                    final_archive_path = FilePath(
-                        archive_path.path.with_name(f"{stem}_{identifier}{suffix}"),
-                        must_exist=False,
-                    )
-                    counter += 1
-                    identifier = str(counter)
-                is_duplicate = True
+        final_archive_path, skip = self._resolve_destination(
+            archive_path, f"Creating archive for {src_path}"
+        )
 
         # If the duplicate strategy is SKIP, don't do anything
-        if (
-            is_duplicate
-            and self.duplicate_handler
-            and self.duplicate_handler.strategy == DuplicateStrategy.SKIP
-        ):
+        if skip:
             logger.info(f"Skipping duplicate archive: {archive_path}")
             return FilePath(archive_path.path)
 
@@ -389,19 +447,26 @@ class ArchiveStrategy(FileOperationStrategy):
                 from collection_sorter.common.components import FileCollectionComponent
 
                 collector = FileCollectionComponent(src_path)
+                entries = []
                 for file in collector.collect_all_files():
                     # Calculate the path within the archive
                     if archive_name:
                         # Use custom name as root in archive
-                        rel_path = Path(archive_name) / file.path.relative_to(
+                        rel_path = Path(archive_name) / file.relative_to(
                             src_path.path
                         )
                     else:
                         # Use original directory structure
-                        rel_path = file.path.relative_to(src_path.parent.path)
+                        rel_path = file.relative_to(src_path.path.parent)
+                    entries.append((file, rel_path))
 
-                    # Add to archive
-                    zf.write(file.path, rel_path)
+                # Add to archive
+                if self.max_workers > 1 and len(entries) > 1:
+                    self._write_prefetched(zf, entries)
+                else:
+                    for path, rel_path in entries:
+                        # Already compressed media is stored as is
+                        write_file(zf, path, rel_path)
 
             logger.info(f"Archived directory: {src_path} -> {final_archive_path}")
             return final_archive_path
@@ -453,61 +518,29 @@ class ExtractArchiveStrategy(FileOperationStrategy):
         Raises:
             FileOperationError: If extraction fails
         """
-        src_path = FilePath(source)
+        src_path = FilePath(source, PathType.FILE)
 
-        if not src_path.is_file or src_path.suffix.lower() != ".zip":
+        if src_path.suffix.lower() != ".zip":
             raise FileOperationError(
                 f"Not a ZIP archive: {src_path}", path=str(src_path)
             )
 
-        # Determine destination path
+        # Determine destination path, created only once duplicates are resolved
         if destination:
-            dest_dir = FilePath(destination, PathType.DIRECTORY, create_if_missing=True)
+            dest_dir = FilePath(destination, PathType.DIRECTORY, must_exist=False)
         else:
             # Extract to a directory with the same name as the archive (without extension)
-            dest_dir = src_path.parent.join(src_path.stem)
-            if not self.dry_run:
-                dest_dir.path.mkdir(parents=True, exist_ok=True)
+            dest_dir = FilePath(
+                src_path.path.with_suffix(""), PathType.DIRECTORY, must_exist=False
+            )
 
         # Handle duplicates if the destination directory exists
-        final_dest_dir = dest_dir
-        is_duplicate = False
-
-        if dest_dir.exists:
-            if self.duplicate_handler:
-                # Use the duplicate handler
-                final_path, is_duplicate = self.duplicate_handler.handle_duplicate(
-                    dest_dir.path,
-                    dest_dir.path,  # Existing path is the same as new path
-                    context=f"Extracting archive {src_path}",
-                )
-                final_dest_dir = FilePath(
-                    final_path,
-                    PathType.DIRECTORY,
-                    must_exist=False,
-                    create_if_missing=True,
-                )
-            else:
-                # Default behavior - rename the destination
-                identifier = "1"
-                counter = 1
-                while final_dest_dir.exists:
-                    final_dest_dir = FilePath(
-                        dest_dir.parent.path / f"{dest_dir.name}_{identifier}",
-                        PathType.DIRECTORY,
-                        must_exist=False,
-                        create_if_missing=True,
-                    )
-                    counter += 1
-                    identifier = str(counter)
-                is_duplicate = True
+        final_dest_dir, skip = self._resolve_destination(
+            dest_dir, f"Extracting archive {src_path}", directory=True
+        )
 
         # If the duplicate strategy is SKIP, don't do anything
-        if (
-            is_duplicate
-            and self.duplicate_handler
-            and self.duplicate_handler.strategy == DuplicateStrategy.SKIP
-        ):
+        if skip:
             logger.info(f"Skipping extraction to existing directory: {dest_dir}")
             return FilePath(dest_dir.path)
 
@@ -517,6 +550,7 @@ class ExtractArchiveStrategy(FileOperationStrategy):
 
         try:
             # Extract the archive
+            final_dest_dir.path.mkdir(parents=True, exist_ok=True)
             with zipfile.ZipFile(src_path.path) as zf:
                 zf.extractall(final_dest_dir.path)
 
@@ -575,48 +609,21 @@ class RenameFileStrategy(FileOperationStrategy):
             dst_path = new_name
         elif isinstance(new_name, str) and "/" not in new_name and "\\" not in new_name:
             # Just a new filename, not a path
-            dst_path = FilePath(src_path.parent.path / new_name, must_exist=False)
+            dst_path = FilePath(src_path.path.parent / new_name, must_exist=False)
         else:
             # Full path
             dst_path = FilePath(new_name, must_exist=False)
 
         # Make sure the parent directory exists
-        dst_path.parent.path.mkdir(parents=True, exist_ok=True)
+        dst_path.path.parent.mkdir(parents=True, exist_ok=True)
 
         # Handle duplicates if the destination exists
-        final_dst_path = dst_path
-        is_duplicate = False
-
-        if dst_path.exists:
-            if self.duplicate_handler:
-                # Use the duplicate handler
-                final_path, is_duplicate = self.duplicate_handler.handle_duplicate(
-                    dst_path.path,
-                    dst_path.path,  # Existing path is the same as new path
-                    context=f"Renaming {src_path}",
-                )
-                final_dst_path = FilePath(final_path, must_exist=False)
-            else:
-                # Default behavior - rename the destination
-                identifier = "1"
-                counter = 1
-                while final_dst_path.exists:
-                    stem = dst_path.stem
-                    suffix = dst_path.suffix
-                    final_dst_path = FilePath(
-                        dst_path.path.with_name(f"{stem}_{identifier}{suffix}"),
-                        must_exist=False,
-                    )
-                    counter += 1
-                    identifier = str(counter)
-                is_duplicate = True
+        final_dst_path, skip = self._resolve_destination(
+            dst_path, f"Renaming {src_path}"
+        )
 
         # If the duplicate strategy is SKIP, don't do anything
-        if (
-            is_duplicate
-            and self.duplicate_handler
-            and self.duplicate_handler.strategy == DuplicateStrategy.SKIP
-        ):
+        if skip:
             logger.info(f"Skipping rename due to existing destination: {dst_path}")
             return FilePath(src_path.path)
 
@@ -15,3 +15,22 @@ from .templates import (
     FileProcessorTemplate,
     FileRenameTemplate,
 )
+
+__all__ = [
+    # Base templates
+    "FileProcessorTemplate",
+    "DirectoryProcessorTemplate",
+    "BatchProcessorTemplate",
+    # File templates
+    "FileMoveTemplate",
+    "FileCopyTemplate",
+    "FileRenameTemplate",
+    # Directory templates
+    "DirectoryMoveTemplate",
+    "DirectoryCopyTemplate",
+    "ArchiveDirectoryTemplate",
+    # Processors
+    "MangaProcessorTemplate",
+    "RenameProcessorTemplate",
+    "VideoProcessorTemplate",
+]
@@ -8,11 +8,16 @@ with enhanced parameter validation.
 import logging
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from collection_sorter.files import FilePath
+from collection_sorter.files.archive import compress_type
 from collection_sorter.files.duplicates import DuplicateHandler
+from collection_sorter.files.move import copy_tree, rename_directory
+from collection_sorter.manga.manga import MangaParser
 from collection_sorter.result import ErrorType, OperationError, PathResult, Result
 from collection_sorter.templates.processors.base import (
     BaseFileProcessor,
@@ -23,6 +28,9 @@ from collection_sorter.templates.processors.base import (
 
 logger = logging.getLogger("processors.manga")
 
+# Manga directories are I/O bound, so use more threads than cores
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 class MangaTemplateValidator(Validator):
     """Validator for manga template functions."""
@@ -161,6 +169,7 @@ class MangaProcessorTemplate(BaseFileProcessor):
         dry_run: bool = False,
         interactive: bool = False,
         duplicate_handler: Optional[DuplicateHandler] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the manga processor template with validation.
@@ -175,6 +184,8 @@ class MangaProcessorTemplate(BaseFileProcessor):
             dry_run: Whether to simulate operations
             interactive: Whether to prompt for confirmation
             duplicate_handler: Optional handler for duplicates
+            max_workers: Number of manga directories processed in parallel
+                (1 processes them sequentially)
         """
         # Create manga-specific validator
         validator = MangaProcessorValidator()
@@ -194,6 +205,17 @@ class MangaProcessorTemplate(BaseFileProcessor):
         self.author_folders = author_folders
         self.archive = archive
         self.move_source = move_source
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+
+        # Pick the per-directory action once instead of branching for each one
+        if archive:
+            self._manga_action = self._archive_manga
+        elif move_source:
+            self._manga_action = self._move_manga
+        else:
+            self._manga_action = self._copy_manga
+        self._stats_lock = threading.Lock()
+        self._created_dirs: Set[str] = set()
 
         # Extend stats for manga-specific metrics
         self.stats.update(
@@ -210,6 +232,9 @@ class MangaProcessorTemplate(BaseFileProcessor):
         Returns:
             Result with statistics or errors
         """
+        # Directories created by an earlier run may have been removed since
+        self._created_dirs.clear()
+
         try:
             # Additional runtime validation
             if not self.source_path.is_directory:
@@ -232,10 +257,11 @@ class MangaProcessorTemplate(BaseFileProcessor):
             if self.author_folders:
                 return self._process_author_folders()
 
-            # Regular processing of manga directories
-            manga_dirs = [
-                FilePath(d) for d in self.source_path.path.iterdir() if d.is_dir()
-            ]
+            # Regular processing of manga directories. process_batch wraps
+            # each source in a FilePath, so pass plain paths and let scandir
+            # answer is_dir from the directory entry
+            with os.scandir(self.source_path.path) as entries:
+                manga_dirs = [entry.path for entry in entries if entry.is_dir()]
 
             # Validate that we have directories to process
             if not manga_dirs:
@@ -269,9 +295,6 @@ class MangaProcessorTemplate(BaseFileProcessor):
         # When processing author folders, preserve original names
         try:
             if self.archive:
-                # Archive the entire directory
-                from zipfile import ZIP_DEFLATED, ZipFile
-
                 # Create author directory in destination (handle None destination)
                 if not self.destination_path:
                     logger.warning(
@@ -280,7 +303,7 @@ class MangaProcessorTemplate(BaseFileProcessor):
                     return Result.success(self.stats)
 
                 author_dest = self.destination_path.join(self.source_path.name)
-                if not author_dest.exists and not self.dry_run:
+                if not self.dry_run:
                     author_dest.path.mkdir(parents=True, exist_ok=True)
 
                 # Process each manga directory separately
@@ -290,43 +313,28 @@ class MangaProcessorTemplate(BaseFileProcessor):
 
                 if self.dry_run:
                     for manga_dir in manga_dirs:
-                        manga_name = manga_dir.name.split("]")[-1].strip()
-                        archive_path = author_dest.join(f"{manga_name}.zip")
-                        logger.info(f"Would archive {manga_dir} to {archive_path}")
+                        manga_name = self._author_manga_name(manga_dir)
+                        archive_path = os.path.join(
+                            author_dest.path, f"{manga_name}.zip"
+                        )
+                        logger.info("Would archive %s to %s", manga_dir, archive_path)
 
                     self.stats["processed"] += len(manga_dirs)
                     self.stats["archived"] += len(manga_dirs)
                     return Result.success(self.stats)
 
-                # Process each manga directory
-                from zipfile import ZIP_DEFLATED, ZipFile
-
+                # Process each manga directory, one worker per archive path
+                author_dest_str = str(author_dest.path)
+                targets = []
                 for manga_dir in manga_dirs:
-                    # Extract manga name from directory name (after the last bracket)
-                    manga_name = manga_dir.name.split("]")[-1].strip()
-                    archive_path = author_dest.join(f"{manga_name}.zip")
-
-                    # Create the archive
-                    with ZipFile(
-                        archive_path.path,
-                        "w",
-                        compression=ZIP_DEFLATED,
-                        compresslevel=6,
-                    ) as zf:
-                        # Add all files to the archive
-                        for root, dirs, files in os.walk(manga_dir.path):
-                            root_path = Path(root)
-                            for file in files:
-                                file_path = root_path / file
-                                # Calculate the path within the archive
-                                rel_path = file_path.relative_to(manga_dir.path)
-                                # Add to archive
-                                zf.write(file_path, rel_path)
-
-                    logger.info(
-                        f"Archived manga directory {manga_dir} to {archive_path}"
-                    )
-                    self.stats["archived"] += 1
+                    manga_name = self._author_manga_name(manga_dir)
+                    archive_path = os.path.join(author_dest_str, f"{manga_name}.zip")
+                    targets.append((manga_dir, archive_path))
+                self._map_grouped(
+                    lambda target: self._archive_author_manga(*target),
+                    targets,
+                    key=lambda target: target[1],
+                )
 
                 self.stats["processed"] += 1
 
@@ -359,24 +367,27 @@ class MangaProcessorTemplate(BaseFileProcessor):
                     self.stats["processed"] += 1
                     return Result.success(self.stats)
 
+                # On the same file system with nothing to merge, a move is a
+                # single rename instead of copying every file
+                if self.move_source and rename_directory(
+                    self.source_path.path, dest_path.path
+                ):
+                    logger.info(f"Moved {self.source_path} to {dest_path}")
+                    self.stats["moved"] += 1
+                    self.stats["processed"] += 1
+                    return Result.success(self.stats)
+
                 # Create destination if it doesn't exist - always use exist_ok=True for test compatibility
                 dest_path.path.mkdir(parents=True, exist_ok=True)
 
-                # Move or copy the directory
+                # Move or copy the directory, keeping files already there
                 import shutil
 
                 if self.move_source:
                     try:
-                        # Use manual copy for move since shutil.move might fail with existing directories
-                        for root, dirs, files in os.walk(self.source_path.path):
-                            rel_path = os.path.relpath(root, self.source_path.path)
-                            target_dir = os.path.join(dest_path.path, rel_path)
-                            os.makedirs(target_dir, exist_ok=True)
-                            for file in files:
-                                src_file = os.path.join(root, file)
-                                dst_file = os.path.join(target_dir, file)
-                                if not os.path.exists(dst_file):
-                                    shutil.copy2(src_file, dst_file)
+                        copy_tree(
+                            self.source_path.path, dest_path.path, overwrite=False
+                        )
 
                         # Remove source after copying
                         shutil.rmtree(str(self.source_path.path))
@@ -388,37 +399,8 @@ class MangaProcessorTemplate(BaseFileProcessor):
                         logger.info(f"Moved {self.source_path} to {dest_path}")
                         self.stats["moved"] += 1
                 else:
-                    try:
-                        # Copy files individually
-                        for root, dirs, files in os.walk(self.source_path.path):
-                            rel_path = os.path.relpath(root, self.source_path.path)
-                            target_dir = os.path.join(dest_path.path, rel_path)
-                            os.makedirs(target_dir, exist_ok=True)
-                            for file in files:
-                                src_file = os.path.join(root, file)
-                                dst_file = os.path.join(target_dir, file)
-                                if not os.path.exists(dst_file):
-                                    shutil.copy2(src_file, dst_file)
-                        logger.info(f"Copied {self.source_path} to {dest_path}")
-                    except Exception as e:
-                        logger.warning(f"Manual copy failed, trying fallback: {e}")
-                        # Try fallback with dirs_exist_ok parameter if available (Python 3.8+)
-                        kwargs = {}
-                        if (
-                            hasattr(shutil, "copytree")
-                            and "dirs_exist_ok" in shutil.copytree.__code__.co_varnames
-                        ):
-                            kwargs["dirs_exist_ok"] = True
-                        try:
-                            shutil.copytree(
-                                str(self.source_path.path),
-                                str(dest_path.path),
-                                **kwargs,
-                            )
-                        except FileExistsError:
-                            # If destination exists, just log success since the files should be there
-                            pass
-                        logger.info(f"Copied {self.source_path} to {dest_path}")
+                    copy_tree(self.source_path.path, dest_path.path, overwrite=False)
+                    logger.info(f"Copied {self.source_path} to {dest_path}")
 
                 self.stats["processed"] += 1
                 return Result.success(self.stats)
@@ -433,8 +415,136 @@ class MangaProcessorTemplate(BaseFileProcessor):
             self.stats["errors"] += 1
             return Result.failure([error])
 
+    def _count(self, key: str) -> None:
+        """Increment a statistics counter, safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _ensure_directory(self, path: str) -> None:
+        """
+        Create a destination directory, once per run.
+
+        Authors usually have many manga, so remember created directories
+        instead of calling makedirs for each one. makedirs with exist_ok=True
+        is safe to race, so workers need no lock here.
+
+        Args:
+            path: Directory to create
+        """
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def _map_grouped(
+        self, func: Callable[[Any], Any], items: List[Any], key: Callable[[Any], Any]
+    ) -> List[Any]:
+        """
+        Apply a function to every item on a thread pool.
+
+        Items with the same key write the same target, so they are handled
+        in order by a single worker rather than concurrently.
+
+        Args:
+            func: Function to apply to each item
+            items: Items to process
+            key: Function returning the target an item writes to
+
+        Returns:
+            Results of func, in item order
+        """
+        workers = min(self.max_workers, len(items))
+        if workers <= 1 or self.interactive:
+            return [func(item) for item in items]
+
+        groups: Dict[Any, List[int]] = {}
+        for index, item in enumerate(items):
+            groups.setdefault(key(item), []).append(index)
+
+        outcomes: List[Any] = [None] * len(items)
+
+        def process_group(indexes: List[int]) -> None:
+            for index in indexes:
+                outcomes[index] = func(items[index])
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_group, g) for g in groups.values()]
+            for future in futures:
+                future.result()
+
+        return outcomes
+
+    def _process_batch_items(
+        self, sources: List[FilePath], destination: FilePath, **kwargs
+    ) -> Tuple[List[Path], List[OperationError]]:
+        """
+        Process manga directories on a thread pool.
+
+        Directories that parse to the same author and name share a worker.
+
+        Args:
+            sources: Source manga directory paths
+            destination: Destination base path
+            **kwargs: Additional arguments
+
+        Returns:
+            Tuple of processed paths and errors, in source order
+        """
+        # Parse each name once, for grouping and for processing
+        items = [(source, MangaParser.parse(source.name)) for source in sources]
+        process_item = self._process_batch_item
+        outcomes = self._map_grouped(
+            lambda item: process_item(
+                item[0], destination, manga_info=item[1], **kwargs
+            ),
+            items,
+            key=lambda item: (item[1]["author"], item[1]["name"]),
+        )
+
+        results = []
+        errors = []
+        for outcome in outcomes:
+            if outcome.is_success():
+                results.append(outcome.unwrap())
+            else:
+                errors.append(outcome.error())
+
+        return results, errors
+
+    @staticmethod
+    def _author_manga_name(manga_dir: FilePath) -> str:
+        """Extract the manga name from a directory name (after the last bracket)."""
+        return manga_dir.name.split("]")[-1].strip()
+
+    def _archive_author_manga(self, manga_dir: FilePath, archive_path: str) -> None:
+        """
+        Archive one manga directory of an author folder.
+
+        Args:
+            manga_dir: Manga directory to archive
+            archive_path: Path of the archive to create
+        """
+        from zipfile import ZIP_DEFLATED, ZipFile
+
+        with ZipFile(
+            archive_path, "w", compression=ZIP_DEFLATED, compresslevel=6
+        ) as zf:
+            # Add all files to the archive, relative to the manga directory
+            join = os.path.join
+            write = zf.write
+            for root, dirs, files in os.walk(manga_dir.path):
+                arc_root = os.path.relpath(root, manga_dir.path)
+                for file in files:
+                    write(join(root, file), join(arc_root, file), compress_type(file))
+
+        logger.info("Archived manga directory %s to %s", manga_dir, archive_path)
+        self._count("archived")
+
     def _process_batch_item(
-        self, source: FilePath, destination: FilePath, **kwargs
+        self,
+        source: FilePath,
+        destination: FilePath,
+        manga_info: Optional[Dict[str, Any]] = None,
+        **kwargs,
     ) -> PathResult:
         """
         Process a single manga directory.
@@ -442,104 +552,140 @@ class MangaProcessorTemplate(BaseFileProcessor):
         Args:
             source: Source manga directory path
             destination: Destination base path
+            manga_info: Already parsed directory name, parsed here if omitted
             **kwargs: Additional arguments
 
         Returns:
             Result with processed path or error
         """
         try:
-            self.stats["processed"] += 1
+            self._count("processed")
 
             # Parse manga info from directory name
-            from collection_sorter.manga.manga import MangaParser
-
-            manga_info = MangaParser.parse(source.name)
+            if manga_info is None:
+                manga_info = MangaParser.parse(source.name)
 
             # Handle None destination
             if not destination:
-                logger.warning(f"No destination specified for processing {source}")
+                logger.warning("No destination specified for processing %s", source)
                 return Result.success(source)
 
-            # Create destination directory for this author
-            author_dir = destination.join(manga_info["author"])
-            if not author_dir.exists and not self.dry_run:
-                author_dir.path.mkdir(parents=True, exist_ok=True)
+            # Build target paths as strings: FilePath.join resolves every
+            # component, which costs several stat calls per directory
+            author_dir = os.path.join(destination.path, manga_info["author"])
+            if not self.dry_run:
+                self._ensure_directory(author_dir)
 
-            # Use manga name from parsed info
-            manga_name = manga_info["name"]
+            return self._manga_action(source, author_dir, manga_info["name"])
 
-            # Handle based on options
-            if self.archive:
-                # Archive the directory
-                from zipfile import ZIP_DEFLATED, ZipFile
+        except Exception as e:
+            error = OperationError(
+                type=ErrorType.OPERATION_FAILED,
+                message=f"Failed to process manga directory {source}: {str(e)}",
+                path=str(source),
+                source_exception=e,
+            )
+            self._count("errors")
+            return Result.failure(error)
 
-                # Create the archive path
-                archive_path = author_dir.join(f"{manga_name}.zip")
+    def _archive_manga(
+        self, source: FilePath, author_dir: str, manga_name: str
+    ) -> PathResult:
+        """
+        Archive a manga directory into its author directory.
 
-                if self.dry_run:
-                    logger.info(f"Would archive {source} to {archive_path}")
-                    self.stats["archived"] += 1
-                    return Result.success(archive_path)
-
-                # Create the archive
-                with ZipFile(
-                    archive_path.path, "w", compression=ZIP_DEFLATED, compresslevel=6
-                ) as zf:
-                    # Add all files to the archive
-                    for root, dirs, files in os.walk(source.path):
-                        root_path = Path(root)
-                        for file in files:
-                            file_path = root_path / file
-                            # Calculate the path within the archive
-                            rel_path = file_path.relative_to(source.path)
-                            # Add to archive using Path object for joining
-                            zf.write(file_path, str(Path(manga_name) / rel_path))
-
-                logger.info(f"Archived {source} to {archive_path}")
-                self.stats["archived"] += 1
+        Args:
+            source: Source manga directory path
+            author_dir: Destination author directory
+            manga_name: Parsed manga name
 
-                # Remove source if requested
-                if self.move_source:
-                    import shutil
+        Returns:
+            Result with the archive path
+        """
+        from zipfile import ZIP_DEFLATED, ZipFile
 
-                    shutil.rmtree(source.path)
-                    logger.info(f"Removed source directory after archiving: {source}")
-                    self.stats["moved"] += 1
+        archive_path = os.path.join(author_dir, f"{manga_name}.zip")
 
-                return Result.success(archive_path)
-            else:
-                # Move or copy the directory
-                dest_path = author_dir.join(manga_name)
+        if self.dry_run:
+            logger.info("Would archive %s to %s", source, archive_path)
+            self._count("archived")
+            return Result.success(FilePath(archive_path, must_exist=False))
 
-                if self.dry_run:
-                    if self.move_source:
-                        logger.info(f"Would move {source} to {dest_path}")
-                    else:
-                        logger.info(f"Would copy {source} to {dest_path}")
-                    return Result.success(dest_path)
+        with ZipFile(
+            archive_path, "w", compression=ZIP_DEFLATED, compresslevel=6
+        ) as zf:
+            # Add all files to the archive under the manga name
+            join = os.path.join
+            write = zf.write
+            for root, dirs, files in os.walk(source.path):
+                arc_root = join(manga_name, os.path.relpath(root, source.path))
+                for file in files:
+                    write(join(root, file), join(arc_root, file), compress_type(file))
 
-                # Create destination if it doesn't exist - always use exist_ok=True for test compatibility
-                dest_path.path.mkdir(parents=True, exist_ok=True)
+        logger.info("Archived %s to %s", source, archive_path)
+        self._count("archived")
 
-                # Move or copy the directory
-                import shutil
+        # Remove source if requested
+        if self.move_source:
+            import shutil
 
-                if self.move_source:
-                    shutil.move(str(source.path), str(dest_path.path))
-                    logger.info(f"Moved {source} to {dest_path}")
-                    self.stats["moved"] += 1
-                else:
-                    shutil.copytree(str(source.path), str(dest_path.path))
-                    logger.info(f"Copied {source} to {dest_path}")
+            shutil.rmtree(source.path)
+            logger.info("Removed source directory after archiving: %s", source)
+            self._count("moved")
 
-                return Result.success(dest_path)
+        return Result.success(FilePath(archive_path))
 
-        except Exception as e:
-            error = OperationError(
-                type=ErrorType.OPERATION_FAILED,
-                message=f"Failed to process manga directory {source}: {str(e)}",
-                path=str(source),
-                source_exception=e,
-            )
-            self.stats["errors"] += 1
-            return Result.failure(error)
+    def _move_manga(
+        self, source: FilePath, author_dir: str, manga_name: str
+    ) -> PathResult:
+        """
+        Move a manga directory into its author directory.
+
+        Args:
+            source: Source manga directory path
+            author_dir: Destination author directory
+            manga_name: Parsed manga name
+
+        Returns:
+            Result with the destination path
+        """
+        import shutil
+
+        dest_path = os.path.join(author_dir, manga_name)
+
+        if self.dry_run:
+            logger.info("Would move %s to %s", source, dest_path)
+            return Result.success(FilePath(dest_path, must_exist=False))
+
+        # Create destination if it doesn't exist - always use exist_ok=True for test compatibility
+        os.makedirs(dest_path, exist_ok=True)
+        shutil.move(str(source.path), dest_path)
+        logger.info("Moved %s to %s", source, dest_path)
+        self._count("moved")
+
+        return Result.success(FilePath(dest_path))
+
+    def _copy_manga(
+        self, source: FilePath, author_dir: str, manga_name: str
+    ) -> PathResult:
+        """
+        Copy a manga directory into its author directory.
+
+        Args:
+            source: Source manga directory path
+            author_dir: Destination author directory
+            manga_name: Parsed manga name
+
+        Returns:
+            Result with the destination path
+        """
+        dest_path = os.path.join(author_dir, manga_name)
+
+        if self.dry_run:
+            logger.info("Would copy %s to %s", source, dest_path)
+            return Result.success(FilePath(dest_path, must_exist=False))
+
+        copy_tree(source.path, dest_path)
+        logger.info("Copied %s to %s", source, dest_path)
+
+        return Result.success(FilePath(dest_path))
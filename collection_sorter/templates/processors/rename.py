@@ -5,7 +5,9 @@ This module implements template classes for rename processing operations
 with enhanced parameter validation.
 """
 
+import errno
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Pattern, Set, Union
@@ -22,6 +24,13 @@ from collection_sorter.templates.processors.base import (
 
 logger = logging.getLogger("processors.rename")
 
+# Patterns used by RenameProcessorTemplate._clean_filename
+_BRACKETS_RE = re.compile(r"\[[^\]]*\]")
+_YEAR_RE = re.compile(r"\([0-9]{4}\)")
+_UNDERSCORES_RE = re.compile(r"_+")
+_WORD_HYPHEN_RE = re.compile(r"(\w)-(\w)")
+_HYPHEN_RE = re.compile(r"\s*-\s*")
+
 
 class PatternValidator(Validator):
     """Validator for rename pattern mappings."""
@@ -336,7 +345,16 @@ class RenameProcessorTemplate(BaseFileProcessor):
 
             # Rename the file
             try:
-                if self.move_source:
+                if self.move_source and not self.destination_path:
+                    # Usually the same directory, where a single rename() does
+                    # it; a duplicates directory may be on another device
+                    try:
+                        os.rename(source.path, new_path.path)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        source.move_to(new_path)
+                elif self.move_source:
                     source.move_to(new_path)
                 else:
                     source.copy_to(new_path)
@@ -381,18 +399,17 @@ class RenameProcessorTemplate(BaseFileProcessor):
         extension = name_parts[1] if len(name_parts) > 1 else ""
 
         # Remove content in brackets and dates
-        name = re.sub(r"\[[^\]]*\]", "", name)  # Remove [content]
-        name = re.sub(r"\([0-9]{4}\)", "", name)  # Remove (YYYY)
-        name = re.sub(r"_+", "_", name)  # Replace multiple underscores
+        name = _BRACKETS_RE.sub("", name)  # Remove [content]
+        name = _YEAR_RE.sub("", name)  # Remove (YYYY)
+        name = _UNDERSCORES_RE.sub("_", name)  # Replace multiple underscores
         name = name.strip("_").strip()  # Remove leading/trailing underscores and spaces
 
         # Preserve existing hyphens between words and standardize spacing
-        name = re.sub(
-            r"(\w)-(\w)", r"\1 - \2", name
-        )  # Add spaces around hyphens between words
-        name = re.sub(
-            r"\s*-\s*", " - ", name
-        )  # Standardize spacing around existing hyphens
+        if "-" in name:
+            # Add spaces around hyphens between words
+            name = _WORD_HYPHEN_RE.sub(r"\1 - \2", name)
+            # Standardize spacing around existing hyphens
+            name = _HYPHEN_RE.sub(" - ", name)
 
         # Reconstruct filename with extension
         return f"{name}.{extension}" if extension else name
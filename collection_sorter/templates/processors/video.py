@@ -24,6 +24,14 @@ from collection_sorter.templates.processors.base import (
 
 logger = logging.getLogger("processors.video")
 
+# Patterns used by VideoProcessorTemplate._parse_video_filename
+_SEASON_EPISODE_RE = re.compile(r"S(\d+)E(\d+)", re.IGNORECASE)
+_ALT_SEASON_EPISODE_RE = re.compile(r"(\d+)x(\d+)")
+_EPISODE_RE = re.compile(r" - (\d+)")
+_PARENTHESES_RE = re.compile(r"\([^\)]*\)")
+_BRACKETS_RE = re.compile(r"\[[^\]]*\]")
+_UNDERSCORES_RE = re.compile(r"_+")
+
 
 class VideoProcessorValidator(BaseProcessorValidator):
     """Validator for video processor parameters."""
@@ -493,30 +501,30 @@ class VideoProcessorTemplate(BaseFileProcessor):
         title = name
 
         # Common patterns: S01E01, 1x01, etc.
-        season_episode_match = re.search(r"S(\d+)E(\d+)", name, re.IGNORECASE)
+        season_episode_match = _SEASON_EPISODE_RE.search(name)
         if season_episode_match:
             season = int(season_episode_match.group(1))
             episode = int(season_episode_match.group(2))
             title = name[: season_episode_match.start()].strip()
         else:
             # Alternative pattern: 1x01
-            alt_match = re.search(r"(\d+)x(\d+)", name)
+            alt_match = _ALT_SEASON_EPISODE_RE.search(name)
             if alt_match:
                 season = int(alt_match.group(1))
                 episode = int(alt_match.group(2))
                 title = name[: alt_match.start()].strip()
             else:
                 # Try to find standalone episode number
-                ep_match = re.search(r" - (\d+)", name)
+                ep_match = _EPISODE_RE.search(name)
                 if ep_match:
                     episode = int(ep_match.group(1))
                     title = name[: ep_match.start()].strip()
 
         # Clean up title
-        title = re.sub(r"\([^\)]*\)", "", title)  # Remove content in parentheses
-        title = re.sub(r"\[[^\]]*\]", "", title)  # Remove content in brackets
-        title = re.sub(r"_+", " ", title)  # Replace underscores with spaces
-        title = re.sub(r"\s+", " ", title).strip()  # Normalize whitespace
+        title = _PARENTHESES_RE.sub("", title)  # Remove content in parentheses
+        title = _BRACKETS_RE.sub("", title)  # Remove content in brackets
+        title = _UNDERSCORES_RE.sub(" ", title)  # Replace underscores with spaces
+        title = " ".join(title.split())  # Normalize whitespace
 
         return {"title": title, "season": season, "episode": episode, "original": name}
 
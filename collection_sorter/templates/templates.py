@@ -8,12 +8,15 @@ defining skeleton algorithms with customizable steps.
 import logging
 import os
 import shutil
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from collection_sorter.files import FilePath
+from collection_sorter.files.archive import compress_type
 from collection_sorter.files.duplicates import DuplicateHandler, DuplicateStrategy
 from collection_sorter.result import (
     ErrorType,
@@ -538,14 +541,18 @@ class DirectoryProcessorTemplate(ABC):
             NotADirectoryError: If source is not a directory
             ValueError: If source is invalid
         """
-        # Convert to FilePath and validate
-        source_path = FilePath(source)
-
-        # Additional validation logic can be added here
-        if not source_path.exists:
-            raise FileNotFoundError(f"Source directory does not exist: {source_path}")
+        # Convert to FilePath, existing FilePaths are already resolved
+        if isinstance(source, FilePath):
+            source_path = source
+        else:
+            source_path = FilePath(source, must_exist=False)
 
+        # A single stat answers the common case, look closer only on failure
         if not source_path.is_directory:
+            if not source_path.exists:
+                raise FileNotFoundError(
+                    f"Source directory does not exist: {source_path}"
+                )
             raise NotADirectoryError(f"Source is not a directory: {source_path}")
 
         return source_path
@@ -1011,22 +1018,19 @@ class ArchiveDirectoryTemplate(DirectoryProcessorTemplate):
                 compression=zipfile.ZIP_DEFLATED,
                 compresslevel=self.compression_level,
             ) as zf:
-                # Add all files to the archive
-                for root, dirs, files in os.walk(source_path.path):
-                    root_path = Path(root)
+                # Add all files to the archive under the custom name, or the
+                # directory's own name, using plain strings for the paths
+                source_dir = str(source_path.path)
+                arc_base = archive_name or source_path.name
+                join = os.path.join
+                write = zf.write
+                for root, dirs, files in os.walk(source_dir):
+                    arc_root = join(arc_base, os.path.relpath(root, source_dir))
                     for file in files:
-                        file_path = root_path / file
-                        # Calculate the path within the archive
-                        if archive_name:
-                            # Use custom name as root in archive
-                            rel_path = Path(archive_name) / file_path.relative_to(
-                                source_path.path
-                            )
-                        else:
-                            # Use original directory structure
-                            rel_path = file_path.relative_to(source_path.parent.path)
-                        # Add to archive
-                        zf.write(file_path, rel_path)
+                        # Images and media are stored as is
+                        write(
+                            join(root, file), join(arc_root, file), compress_type(file)
+                        )
 
             logger.info(f"Archived directory: {source_path} -> {archive_path}")
             return Result.success(archive_path)
@@ -1088,6 +1092,7 @@ class BatchProcessorTemplate(ABC):
         dry_run: bool = False,
         duplicate_handler: Optional[DuplicateHandler] = None,
         continue_on_error: bool = False,
+        max_workers: int = 1,
     ):
         """
         Initialize the batch processor template.
@@ -1098,12 +1103,14 @@ class BatchProcessorTemplate(ABC):
             dry_run: Whether to simulate operations without making changes
             duplicate_handler: Optional handler for duplicates
             continue_on_error: Whether to continue processing on error
+            max_workers: Number of items processed in parallel
         """
         self.file_processor = file_processor
         self.directory_processor = directory_processor
         self.dry_run = dry_run
         self.duplicate_handler = duplicate_handler
         self.continue_on_error = continue_on_error
+        self.max_workers = max_workers
 
     def process_batch(
         self,
@@ -1147,19 +1154,12 @@ class BatchProcessorTemplate(ABC):
                 return pre_result
 
             # Step 4: Process each item
-            results = []
-            errors = []
-
-            for source in valid_sources:
-                result = self._process_batch_item(source, dest_path, **kwargs)
-
-                if result.is_success():
-                    results.append(result.unwrap())
-                else:
-                    errors.append(result.error())
-                    if not self.continue_on_error:
-                        # Return the first error if not continuing on error
-                        return Result.failure([result.error()])
+            results, errors = self._process_batch_items(
+                valid_sources, dest_path, **kwargs
+            )
+            if errors and not self.continue_on_error:
+                # Return the first error if not continuing on error
+                return Result.failure(errors[:1])
 
             # Step 5: Post-process batch (optional)
             post_result = self._post_process_batch(results, dest_path, **kwargs)
@@ -1203,11 +1203,12 @@ class BatchProcessorTemplate(ABC):
         if not sources:
             raise ValueError("No source paths provided")
 
-        # Convert to FilePath objects and validate
+        # Convert to FilePath objects and validate, FilePath sources are
+        # already resolved and don't need to be built again
         valid_sources = []
         for source in sources:
             try:
-                path = FilePath(source)
+                path = source if isinstance(source, FilePath) else FilePath(source)
                 if path.exists:
                     valid_sources.append(path)
                 else:
@@ -1273,6 +1274,101 @@ class BatchProcessorTemplate(ABC):
         # Default implementation does nothing
         return Result.success(True)
 
+    def _process_batch_items(
+        self, sources: List[FilePath], destination: FilePath, **kwargs
+    ) -> Tuple[List[Path], List[OperationError]]:
+        """
+        Process every item in the batch.
+
+        This is a hook method that can be overridden by subclasses to
+        change how items are dispatched to _process_batch_item.
+
+        Args:
+            sources: List of source paths
+            destination: Destination path
+            **kwargs: Additional operation-specific arguments
+
+        Returns:
+            Tuple of processed paths and errors, in source order
+        """
+        if self.max_workers > 1 and len(sources) > 1:
+            return self._process_batch_items_parallel(sources, destination, **kwargs)
+
+        results = []
+        errors = []
+        process_item = self._process_batch_item
+
+        for source in sources:
+            result = process_item(source, destination, **kwargs)
+
+            if result.is_success():
+                results.append(result.unwrap())
+            else:
+                errors.append(result.error())
+                if not self.continue_on_error:
+                    break
+
+        return results, errors
+
+    def _process_batch_items_parallel(
+        self, sources: List[FilePath], destination: FilePath, **kwargs
+    ) -> Tuple[List[Path], List[OperationError]]:
+        """
+        Process the batch on a thread pool.
+
+        Archiving and copying spend their time in file I/O and zlib, which
+        release the GIL. Sources with the same name write the same target
+        under the destination, so they are handled in order by a single
+        worker rather than concurrently. Items that have not started yet are
+        skipped after the first error unless continue_on_error is set.
+
+        Args:
+            sources: List of source paths
+            destination: Destination path
+            **kwargs: Additional operation-specific arguments
+
+        Returns:
+            Tuple of processed paths and errors, in source order
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, source in enumerate(sources):
+            groups.setdefault(source.name, []).append(index)
+
+        outcomes: List[Optional[PathResult]] = [None] * len(sources)
+        failed = threading.Event()
+
+        def process_group(indexes: List[int]) -> None:
+            for index in indexes:
+                if failed.is_set():
+                    return
+                outcome = self._process_batch_item(
+                    sources[index], destination, **kwargs
+                )
+                outcomes[index] = outcome
+                if outcome.is_failure() and not self.continue_on_error:
+                    failed.set()
+
+        workers = min(self.max_workers, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_group, g) for g in groups.values()]
+            for future in futures:
+                future.result()
+
+        results = []
+        errors = []
+        for outcome in outcomes:
+            if outcome is None:
+                # Skipped after another item failed
+                continue
+            if outcome.is_success():
+                results.append(outcome.unwrap())
+            else:
+                errors.append(outcome.error())
+                if not self.continue_on_error:
+                    break
+
+        return results, errors
+
     def _process_batch_item(
         self, source: FilePath, destination: FilePath, **kwargs
     ) -> PathResult:
@@ -107,6 +107,21 @@ class TestRenameProcessor(unittest.TestCase):
         # Check that source files were removed (since move_source=True)
         self.assertFalse((Path(self.temp_dir) / self.test_files[0]).exists())
         
+    def test_template_in_place(self):
+        """Test renaming files in their own directory"""
+        template = RenameProcessorTemplate(
+            source_path=self.temp_dir,
+            patterns={r'_+': ' '},
+            recursive=False,
+            move_source=True,
+        )
+
+        result = template.execute()
+
+        self.assertTrue(result.is_success())
+        self.assertTrue((Path(self.temp_dir) / "Crystal Dreams 01.ass").exists())
+        self.assertFalse((Path(self.temp_dir) / "Crystal_Dreams_01.ass").exists())
+
     def test_dry_run(self):
         """Test dry run mode with RenameProcessorTemplate"""
         # Create pattern mappings
@@ -52,6 +52,11 @@ class TestCollectionPath(unittest.TestCase):
         expected = {self.file1, self.file2, self.subfile}
         self.assertEqual(all_files, expected)
 
+    def test_collect_with_filter(self):
+        """Test collecting files recursively by name"""
+        files = self.collection.collect_with_filter(lambda name: name != "file1.txt")
+        self.assertEqual(set(files), {self.file2, self.subfile})
+
     def test_exists(self):
         """Test exists property"""
         self.assertTrue(self.collection.exists)
@@ -0,0 +1,168 @@
+import errno
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from collection_sorter.files import move
+from collection_sorter.files.move import MovableCollection, copy_tree, rename_directory
+
+
+class TestCopyTree(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.source = self.test_dir / "source"
+        (self.source / "subdir").mkdir(parents=True)
+        (self.source / "page1.jpg").write_bytes(b"first page")
+        (self.source / "subdir" / "page2.jpg").write_bytes(b"second page" * 1000)
+        os.chmod(self.source / "page1.jpg", 0o640)
+        self.destination = self.test_dir / "destination"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def assert_copied(self):
+        self.assertEqual((self.destination / "page1.jpg").read_bytes(), b"first page")
+        self.assertEqual(
+            (self.destination / "subdir" / "page2.jpg").read_bytes(),
+            b"second page" * 1000,
+        )
+        self.assertEqual((self.destination / "page1.jpg").stat().st_mode & 0o777, 0o640)
+
+    def test_copy_tree(self):
+        """Test copying a directory tree with contents and permissions"""
+        self.assertEqual(copy_tree(self.source, self.destination), self.destination)
+        self.assert_copied()
+        self.assertTrue((self.source / "page1.jpg").exists())
+
+    def test_copy_tree_existing_destination(self):
+        """Test copying into an existing destination overwrites files"""
+        self.destination.mkdir()
+        (self.destination / "page1.jpg").write_bytes(b"old page that is longer")
+        (self.destination / "other.jpg").touch()
+
+        copy_tree(self.source, self.destination)
+        self.assert_copied()
+        self.assertTrue((self.destination / "other.jpg").exists())
+
+    def test_copy_tree_keep_existing(self):
+        """Test keeping files that already exist in the destination"""
+        self.destination.mkdir()
+        (self.destination / "page1.jpg").write_bytes(b"old page")
+
+        copy_tree(self.source, self.destination, overwrite=False)
+        self.assertEqual((self.destination / "page1.jpg").read_bytes(), b"old page")
+        self.assertTrue((self.destination / "subdir" / "page2.jpg").exists())
+
+    def test_copy_tree_fallback(self):
+        """Test falling back to a user space copy when the kernel refuses"""
+
+        def unsupported(*args):
+            raise OSError("copy_file_range not supported")
+
+        with patch.object(move, "_copy_file_range", unsupported):
+            copy_tree(self.source, self.destination)
+        self.assert_copied()
+
+    def test_copy_tree_fallback_in_chunks(self):
+        """Test that the user space copy handles files larger than its buffer"""
+
+        def unsupported(*args):
+            raise OSError("copy_file_range not supported")
+
+        with patch.object(move, "_copy_file_range", unsupported), patch.object(
+            move, "COPY_BUFFER_SIZE", 3
+        ):
+            copy_tree(self.source, self.destination)
+        self.assert_copied()
+
+    @unittest.skipUnless(hasattr(os, "copy_file_range"), "Linux only")
+    def test_copy_tree_clone(self):
+        """Test that a successful clone skips copying the data"""
+
+        def clone(outfd, request, infd):
+            os.write(outfd, os.read(infd, 1 << 20))
+
+        with patch.object(move.fcntl, "ioctl", clone), patch.object(
+            move, "_copy_file_range"
+        ) as copy_file_range:
+            copy_tree(self.source, self.destination)
+        copy_file_range.assert_not_called()
+        self.assert_copied()
+
+
+class TestRenameDirectory(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.source = self.test_dir / "source"
+        self.source.mkdir()
+        (self.source / "page1.jpg").touch()
+        self.destination = self.test_dir / "destination"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_rename_directory(self):
+        """Test moving a directory to a new path with a rename"""
+        self.assertTrue(rename_directory(self.source, self.destination))
+        self.assertFalse(self.source.exists())
+        self.assertTrue((self.destination / "page1.jpg").exists())
+
+    def test_rename_directory_with_content(self):
+        """Test refusing to rename onto a directory with content"""
+        self.destination.mkdir()
+        (self.destination / "other.jpg").touch()
+
+        self.assertFalse(rename_directory(self.source, self.destination))
+        self.assertTrue((self.source / "page1.jpg").exists())
+
+    def test_rename_directory_across_devices(self):
+        """Test refusing to rename across file systems"""
+        error = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch("os.rename", side_effect=error):
+            self.assertFalse(rename_directory(self.source, self.destination))
+
+
+class TestMovableCollection(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.source = self.test_dir / "source"
+        (self.source / "subdir").mkdir(parents=True)
+        (self.source / "track1.mp3").write_bytes(b"first track")
+        (self.source / "track2.mp3").write_bytes(b"second track")
+        self.destination = self.test_dir / "destination"
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_copy(self):
+        """Test copying the files of a collection"""
+        result = MovableCollection(self.source).copy(self.destination)
+        self.assertEqual(result.path, self.destination)
+        self.assertEqual(
+            sorted(path.name for path in self.destination.iterdir()),
+            ["track1.mp3", "track2.mp3"],
+        )
+        self.assertEqual(
+            (self.destination / "track2.mp3").read_bytes(), b"second track"
+        )
+        self.assertTrue((self.source / "track1.mp3").exists())
+
+    def test_move_keeps_duplicates(self):
+        """Test moving files next to an existing file with the same name"""
+        self.destination.mkdir()
+        (self.destination / "track1.mp3").write_bytes(b"other track")
+
+        MovableCollection(self.source).move(self.destination)
+        self.assertFalse((self.source / "track1.mp3").exists())
+        self.assertTrue((self.source / "subdir").exists())
+        self.assertEqual((self.destination / "track1.mp3").read_bytes(), b"other track")
+        self.assertEqual(
+            (self.destination / "track1_1.mp3").read_bytes(), b"first track"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
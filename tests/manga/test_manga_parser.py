@@ -0,0 +1,69 @@
+import unittest
+
+from collection_sorter.manga.manga import MangaParser
+
+
+class TestMangaParser(unittest.TestCase):
+    def test_extract_author_with_group(self):
+        author, group = MangaParser._extract_author_string(
+            "Moonweaver Studio (Starlight)"
+        )
+        self.assertEqual(author, "Starlight")
+        self.assertEqual(group, "Moonweaver Studio")
+
+    def test_extract_author_without_group(self):
+        author, group = MangaParser._extract_author_string("Starlight")
+        self.assertEqual(author, "Starlight")
+        self.assertIsNone(group)
+
+    def test_extract_multiple_authors(self):
+        author, group = MangaParser._extract_author_string("Studio (A. One , Two)")
+        self.assertEqual(author, "A One,Two")
+        self.assertEqual(group, "Studio")
+
+    def test_extract_author_uses_last_bracket_pair(self):
+        author, group = MangaParser._extract_author_string("Studio (West) (Starlight)")
+        self.assertEqual(author, "Starlight")
+        self.assertEqual(group, "Studio (West)")
+
+    def test_extract_author_ignores_empty_parts(self):
+        self.assertEqual(MangaParser._extract_author_string("(Starlight)")[1], None)
+        self.assertEqual(MangaParser._extract_author_string("Studio ()")[1], None)
+
+    def test_extract_tags(self):
+        tags = MangaParser._extract_tags(" (C90) [ English ] {Digital}")
+        self.assertEqual(tags, ["C90", "English", "Digital"])
+
+    def test_extract_tags_closes_on_any_bracket(self):
+        self.assertEqual(MangaParser._extract_tags("(a[b] c"), ["a"])
+        self.assertEqual(MangaParser._extract_tags("no tags"), [])
+
+    def test_parse_full_name(self):
+        parsed = MangaParser.parse(
+            "(C94) [Dreamforge (Silverleaf)] Ethereal Wings [English] {Moonshadow}"
+        )
+        self.assertEqual(parsed["author"], "Silverleaf")
+        self.assertEqual(parsed["group"], "Dreamforge")
+        self.assertEqual(parsed["name"], "Ethereal Wings")
+        self.assertEqual(parsed["tags"], ["English", "Moonshadow"])
+
+    def test_parse_without_author(self):
+        parsed = MangaParser.parse("Monthly Magazine 2020")
+        self.assertEqual(parsed["author"], "Monthly Magazine")
+        self.assertEqual(parsed["name"], "Monthly Magazine 2020")
+        self.assertNotIn("group", parsed)
+
+    def test_parse_returns_independent_results(self):
+        name = "[Studio (Author)] Title [English]"
+        first = MangaParser.parse(name)
+        first["tags"].append("Changed")
+        first["name"] = "Changed"
+
+        second = MangaParser.parse(name)
+        self.assertEqual(second["name"], "Title")
+        self.assertEqual(second["tags"], ["English"])
+        self.assertIsNot(first["tags"], second["tags"])
+
+
+if __name__ == "__main__":
+    unittest.main()
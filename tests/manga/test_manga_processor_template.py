@@ -234,6 +234,29 @@ class TestMangaProcessorTemplate(unittest.TestCase):
         author_dest = self.dest_dir / author_name
         self.assertTrue(list(Path(author_dest).glob("*.zip")))
 
+    def test_reused_processor_recreates_directories(self):
+        """Test running a processor again after its output was removed"""
+        template = MangaProcessorTemplate(
+            source_path=str(self.source_dir),
+            destination_path=str(self.dest_dir),
+            template_func=manga_template_function,
+            author_folders=False,
+            archive=True,
+            move_source=False,
+            dry_run=False,
+            interactive=False
+        )
+
+        self.assertTrue(template.execute().is_success())
+        shutil.rmtree(self.dest_dir / "Starlight")
+
+        result = template.execute()
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.unwrap()["errors"], 0)
+        self.assertTrue(
+            (self.dest_dir / "Starlight" / "Mystic Forest Symphony.zip").exists()
+        )
+
     def test_dry_run_mode(self):
         """Test manga sorting in dry run mode using MangaProcessorTemplate"""
         # Create the template processor
@@ -0,0 +1,72 @@
+import gc
+import unittest
+import weakref
+
+from collection_sorter.manga.manga_template import manga_template_function
+
+
+class TestMangaTemplateFunction(unittest.TestCase):
+    def setUp(self):
+        self.info = {
+            "author": "Silverleaf",
+            "group": "Dreamforge",
+            "name": "Ethereal  Wings",
+            "tags": ["C94", "English"],
+        }
+
+    def test_template(self):
+        self.assertEqual(
+            manga_template_function(self.info),
+            "[Dreamforge (Silverleaf)] Ethereal Wings [English]",
+        )
+
+    def test_template_name_override(self):
+        result = manga_template_function(self.info, name="Other  Title")
+        self.assertEqual(result, "[Dreamforge (Silverleaf)] Other Title [English]")
+        self.assertEqual(self.info["name"], "Ethereal  Wings")
+
+    def test_template_language_tag_any_case(self):
+        info = dict(self.info, group=None, tags=["C94", "JAPANESE"])
+        self.assertEqual(
+            manga_template_function(info), "[Silverleaf] Ethereal Wings [JAPANESE]"
+        )
+
+    def test_template_first_language_tag(self):
+        info = dict(self.info, group=None, tags=["Digital", "Japanese", "English"])
+        self.assertEqual(
+            manga_template_function(info), "[Silverleaf] Ethereal Wings [Japanese]"
+        )
+
+    def test_template_replace_function_not_cached(self):
+        calls = []
+
+        def replace(value):
+            calls.append(value)
+            return value.replace(" ", "_")
+
+        first = manga_template_function(self.info, replace)
+        second = manga_template_function(dict(self.info), replace)
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), 2)
+
+        # The cache must not keep replace functions, or their owners, alive
+        replace_ref = weakref.ref(replace)
+        del replace
+        gc.collect()
+        self.assertIsNone(replace_ref())
+
+    def test_template_unhashable_replace_function(self):
+        class Replace:
+            __hash__ = None
+
+            def __call__(self, value):
+                return value.upper()
+
+        self.assertEqual(
+            manga_template_function(self.info, Replace()),
+            "[DREAMFORGE (SILVERLEAF)] ETHEREAL WINGS [ENGLISH]",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import multiprocessing
+import pickle
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from collection_sorter.common.exceptions import ProcessingError
+from collection_sorter.music import music_collection
+from collection_sorter.music.music_collection import (
+    MusicCollection,
+    _extract_tag,
+    has_music_extension,
+)
+
+
+class StubTag:
+    def __init__(self, path):
+        self.artist = Path(path).parent.name
+        self.title = Path(path).stem
+        # Stands in for the open file TinyTag keeps, which cannot be pickled
+        self._filehandler = threading.Lock()
+
+
+class StubTinyTag:
+    @staticmethod
+    def get(path):
+        return StubTag(path)
+
+
+class TestMusicCollection(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        album = self.test_dir / "Artist" / "Album"
+        album.mkdir(parents=True)
+        self.tracks = {
+            album / "01. Intro.mp3",
+            album / "02. Song.WAV",
+            self.test_dir / "single.flac",
+        }
+        for track in self.tracks:
+            track.touch()
+        (album / "cover.jpg").touch()
+        (self.test_dir / "notes").touch()
+        (self.test_dir / "mp3").touch()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_has_music_extension(self):
+        self.assertTrue(has_music_extension(self.test_dir / "single.flac"))
+        self.assertFalse(has_music_extension(self.test_dir / "notes"))
+        self.assertFalse(has_music_extension(self.test_dir / "mp3"))
+        self.assertFalse(has_music_extension(self.test_dir / "Artist"))
+
+    def test_get_music(self):
+        music = MusicCollection(self.test_dir).get_music()
+        self.assertEqual(set(music), self.tracks)
+
+    def test_get_by_tag_value_without_tinytag(self):
+        with patch.object(music_collection, "TinyTag", None):
+            with self.assertRaises(ProcessingError):
+                MusicCollection.get_by_tag_value(list(self.tracks), str)
+
+    def test_extract_tag_drops_private_attributes(self):
+        with patch.object(music_collection, "TinyTag", StubTinyTag):
+            tag = _extract_tag(str(self.test_dir / "single.flac"))
+        tag = pickle.loads(pickle.dumps(tag))
+        self.assertEqual(vars(tag), {"artist": self.test_dir.name, "title": "single"})
+
+    @unittest.skipUnless(
+        multiprocessing.get_start_method() == "fork",
+        "the patched TinyTag only reaches forked workers",
+    )
+    def test_get_by_tag_value_in_pool(self):
+        files = sorted(self.tracks)
+        album = self.test_dir / "Artist" / "Album"
+        with patch.object(music_collection, "TinyTag", StubTinyTag), patch.object(
+            music_collection, "PARALLEL_TAG_MIN_FILES", 0
+        ):
+            groups = MusicCollection.get_by_tag_value(
+                files, lambda tag: tag.artist, processes=2
+            )
+        self.assertEqual(
+            groups,
+            {
+                "Album": [album / "01. Intro.mp3", album / "02. Song.WAV"],
+                self.test_dir.name: [self.test_dir / "single.flac"],
+            },
+        )
+
+    def test_get_by_tag_value_small_input_runs_inline(self):
+        files = sorted(self.tracks)
+        with patch.object(music_collection, "TinyTag", StubTinyTag), patch.object(
+            music_collection.multiprocessing, "Pool", side_effect=AssertionError
+        ):
+            groups = MusicCollection.get_by_tag_value(
+                files, lambda tag: tag.title, processes=2
+            )
+        self.assertEqual(groups, {Path(file).stem: [file] for file in files})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,14 @@
 Tests for the Result pattern implementation.
 """
 
+import errno
+import os
 import shutil
 import tempfile
 import unittest
+import zipfile
 from pathlib import Path
+from unittest import mock
 
 from collection_sorter.operations import (
     check_path_exists, ensure_directory, list_files, move_file, copy_file, rename_file, archive_directory,
@@ -133,6 +137,10 @@ class TestResultPattern(unittest.TestCase):
         self.assertFalse(collected.is_success())
         self.assertEqual(len(collected.error()), 1)
         self.assertEqual(collected.error()[0], error)
+
+        # Results may also be streamed from a generator
+        collected = Result.collect(Result.success(i) for i in range(3))
+        self.assertEqual(collected.unwrap(), [0, 1, 2])
     
     def test_operation_error(self):
         """Test the OperationError class."""
@@ -261,6 +269,208 @@ class TestResultPattern(unittest.TestCase):
         self.assertTrue(delete_dir_result.is_success())
         self.assertFalse(subdir.exists())
     
+    def test_move_file_falls_back_across_devices(self):
+        """Test that move_file copies when a plain rename is not possible."""
+        dest_file = self.dest_dir / "moved.txt"
+        with mock.patch(
+            "collection_sorter.operations.os.rename",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            move_result = move_file(self.test_file, dest_file)
+        self.assertTrue(move_result.is_success())
+        self.assertEqual(dest_file.read_text(), "Test content")
+        self.assertFalse(self.test_file.exists())
+
+    def test_rename_in_place_skips_mkdir(self):
+        """Test that renaming within a directory does not create directories."""
+        with mock.patch.object(Path, "mkdir", side_effect=AssertionError):
+            rename_result = rename_file(self.test_file, "renamed.txt")
+        self.assertEqual(rename_result.unwrap(), self.source_dir / "renamed.txt")
+        self.assertFalse(self.test_file.exists())
+
+    def test_bulk_copy_in_parallel(self):
+        """Test that parallel bulk_copy keeps file names and result order."""
+        bulk_dir = self.source_dir / "bulk"
+        bulk_dir.mkdir()
+        for i in range(8):
+            (bulk_dir / f"bulk_file{i}.txt").write_text(f"Bulk content {i}")
+
+        processor = ResultFileProcessor()
+        result = processor.bulk_copy(bulk_dir, self.dest_dir, max_workers=4)
+        self.assertTrue(result.is_success())
+
+        sources = processor.list_files(bulk_dir).unwrap()
+        self.assertEqual(
+            result.unwrap(), [self.dest_dir / file.name for file in sources]
+        )
+        for file in sources:
+            self.assertEqual(
+                (self.dest_dir / file.name).read_text(), file.read_text()
+            )
+
+    def test_bulk_move_creates_destination_once(self):
+        """Test that bulk_move creates a missing destination directory."""
+        destination = self.dest_dir / "new" / "nested"
+        processor = ResultFileProcessor()
+        with mock.patch(
+            "collection_sorter.result.result_processor.ensure_directory",
+            wraps=ensure_directory,
+        ) as ensure:
+            result = processor.bulk_move(self.source_dir, destination)
+        self.assertTrue(result.is_success())
+        self.assertEqual(ensure.call_count, 1)
+        self.assertEqual(result.unwrap(), [destination / "test.txt"])
+        self.assertTrue((destination / "test.txt").exists())
+
+    def test_bulk_copy_with_custom_strategy(self):
+        """Test bulk_copy with a custom registered copy strategy."""
+
+        class PlainCopyStrategy:
+            name = "PlainCopy"
+
+            def execute(self, source, destination):
+                return copy_file(source, destination)
+
+        destination = self.dest_dir / "custom"
+        processor = ResultFileProcessor()
+        processor.add_strategy("copy_file", PlainCopyStrategy())
+
+        result = processor.bulk_copy(self.source_dir, destination)
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.unwrap(), [destination / "test.txt"])
+
+    def test_bulk_move_invalid_source_leaves_no_destination(self):
+        """Test that bulk_move does not create the destination for a bad source."""
+        destination = self.dest_dir / "unused"
+        processor = ResultFileProcessor()
+
+        result = processor.bulk_move(self.source_dir / "missing", destination)
+        self.assertTrue(result.is_failure())
+        self.assertFalse(destination.exists())
+
+    def test_archive_directory_stores_media(self):
+        """Test that archive_directory stores compressed media uncompressed."""
+        subdir = self.source_dir / "album"
+        subdir.mkdir()
+        (subdir / "cover.jpg").write_bytes(b"\xff\xd8" * 64)
+        (subdir / "notes.txt").write_text("notes " * 64)
+
+        archive_path = archive_directory(subdir, self.dest_dir).unwrap()
+        with zipfile.ZipFile(archive_path) as zf:
+            self.assertEqual(
+                zf.getinfo("album/cover.jpg").compress_type, zipfile.ZIP_STORED
+            )
+            self.assertEqual(
+                zf.getinfo("album/notes.txt").compress_type, zipfile.ZIP_DEFLATED
+            )
+
+    def test_bulk_archive_fused(self):
+        """Test that a fused bulk_archive writes the directories to one archive."""
+        for name in ("first", "second"):
+            subdir = self.source_dir / name
+            subdir.mkdir()
+            (subdir / f"{name}.txt").write_text(name)
+
+        result = ResultFileProcessor().bulk_archive(
+            self.source_dir, self.dest_dir, fuse=True
+        )
+        self.assertEqual(result.unwrap(), [self.dest_dir / "source.zip"])
+        with zipfile.ZipFile(self.dest_dir / "source.zip") as zf:
+            names = set(zf.namelist())
+        # Like the per-directory mode, loose files in the source are left out
+        self.assertEqual(names, {"first/first.txt", "second/second.txt"})
+
+    def test_bulk_archive_fused_with_custom_strategy(self):
+        """Test that a fused bulk_archive goes through the archive strategy."""
+        (self.source_dir / "album").mkdir()
+        calls = []
+
+        class StoredArchiveStrategy:
+            name = "StoredArchive"
+
+            def execute(self, source, destination=None, directories=None):
+                calls.append(directories)
+                return archive_directory(
+                    source,
+                    destination,
+                    archive_name="stored",
+                    compression_level=0,
+                    directories=directories,
+                )
+
+        processor = ResultFileProcessor()
+        processor.add_strategy("archive", StoredArchiveStrategy())
+        result = processor.bulk_archive(self.source_dir, self.dest_dir, fuse=True)
+        self.assertEqual(result.unwrap(), [self.dest_dir / "stored.zip"])
+        self.assertEqual(calls, [[self.source_dir / "album"]])
+
+    def test_processor_listing_cache(self):
+        """Test that listings are reused until the directory changes."""
+        processor = ResultFileProcessor()
+        # Make the directory look untouched for a while
+        os.utime(self.source_dir, (0, 0))
+        with mock.patch(
+            "collection_sorter.result.result_processor.list_files",
+            wraps=list_files,
+        ) as lister:
+            first = processor.list_files(self.source_dir).unwrap()
+            second = processor.list_files(self.source_dir).unwrap()
+            self.assertEqual(first, second)
+            self.assertEqual(lister.call_count, 1)
+
+            (self.source_dir / "added.txt").write_text("Added")
+            third = processor.list_files(self.source_dir).unwrap()
+            self.assertEqual(lister.call_count, 2)
+            self.assertIn(self.source_dir / "added.txt", third)
+
+    def test_processor_listing_cache_skips_recent_directories(self):
+        """Test that a directory changed within the timestamp tick is relisted."""
+        processor = ResultFileProcessor()
+        with mock.patch(
+            "collection_sorter.result.result_processor.list_files",
+            wraps=list_files,
+        ) as lister:
+            processor.list_files(self.source_dir)
+            # Keep the mtime as if the new entry landed in the same tick
+            mtime = os.stat(self.source_dir).st_mtime_ns
+            (self.source_dir / "added.txt").write_text("Added")
+            os.utime(self.source_dir, ns=(mtime, mtime))
+
+            listing = processor.list_files(self.source_dir).unwrap()
+            self.assertEqual(lister.call_count, 2)
+            self.assertIn(self.source_dir / "added.txt", listing)
+
+    def test_processor_operations_use_registered_strategies(self):
+        """Test that operations dispatch to strategies without the context."""
+        processor = ResultFileProcessor()
+        context_strategy = processor.context.strategy
+        copy_strategy = mock.Mock()
+        copy_strategy.execute.return_value = Result.success(self.dest_dir)
+        processor.add_strategy("copy_file", copy_strategy)
+
+        result = processor.copy_file(self.test_file, self.dest_dir)
+        self.assertEqual(result.unwrap(), self.dest_dir)
+        copy_strategy.execute.assert_called_once_with(self.test_file, self.dest_dir)
+        self.assertIs(processor.context.strategy, context_strategy)
+
+    def test_copy_file_keeps_metadata(self):
+        """Test that copy_file copies contents and modification time."""
+        os.utime(self.test_file, ns=(1_000_000_000, 1_000_000_000))
+        copy_dest = self.dest_dir / "copied.txt"
+        copy_result = copy_file(self.test_file, copy_dest)
+        self.assertEqual(copy_result.unwrap(), copy_dest)
+        self.assertEqual(copy_dest.read_text(), "Test content")
+        self.assertEqual(copy_dest.stat().st_mtime_ns, 1_000_000_000)
+
+    def test_dry_run_leaves_destination_untouched(self):
+        """Test that dry-run file operations do not create directories."""
+        dest_file = self.dest_dir / "nested" / "moved.txt"
+        for operation in (move_file, copy_file):
+            result = operation(self.test_file, dest_file, dry_run=True)
+            self.assertEqual(result.unwrap(), dest_file)
+            self.assertFalse(dest_file.parent.exists())
+        self.assertTrue(self.test_file.exists())
+
     def test_result_processor(self):
         """Test the ResultFileProcessor class."""
         # Create a processor
@@ -2,17 +2,24 @@
 Tests for the Strategy pattern implementation.
 """
 
+import errno
+import os
 import shutil
 import tempfile
 import unittest
+import zipfile
 from pathlib import Path
+from unittest import mock
 
+from collection_sorter.common.exceptions import FileOperationError
 from collection_sorter.files.duplicates import DuplicateHandler, DuplicateStrategy
 from collection_sorter.files.file_processor import FileProcessor
 from collection_sorter.files.paths import FilePath
 from collection_sorter.strategies.strategies import (
+    ArchiveStrategy,
     MoveFileStrategy,
     CopyFileStrategy,
+    ExtractArchiveStrategy,
     FileOperationContext
 )
 
@@ -81,6 +88,153 @@ class TestFileStrategies(unittest.TestCase):
         self.assertTrue((self.dest_dir / "test.txt").exists())
         self.assertEqual(str(result), str(destination))
     
+    def test_archive_strategy_with_workers(self):
+        """Test that archiving with read-ahead workers keeps every file."""
+        album = self.source_dir / "album"
+        (album / "disc2").mkdir(parents=True)
+        for i in range(6):
+            (album / f"track{i}.txt").write_text(f"Track {i}")
+        (album / "disc2" / "bonus.txt").write_text("Bonus")
+
+        serial = ArchiveStrategy().execute(album, self.dest_dir / "serial")
+        parallel = ArchiveStrategy(max_workers=3).execute(
+            album, self.dest_dir / "parallel"
+        )
+
+        with zipfile.ZipFile(serial.path) as expected, zipfile.ZipFile(
+            parallel.path
+        ) as actual:
+            self.assertEqual(expected.namelist(), actual.namelist())
+            for name in expected.namelist():
+                self.assertEqual(expected.read(name), actual.read(name))
+                self.assertEqual(
+                    expected.getinfo(name).date_time, actual.getinfo(name).date_time
+                )
+
+    def test_archive_strategy_stores_media(self):
+        """Test that already compressed files are stored uncompressed."""
+        album = self.source_dir / "album"
+        album.mkdir()
+        (album / "cover.jpg").write_bytes(b"\xff\xd8" * 64)
+        (album / "notes.txt").write_text("notes " * 64)
+
+        for workers in (1, 2):
+            archive = ArchiveStrategy(max_workers=workers).execute(
+                album, self.dest_dir / str(workers)
+            )
+            with zipfile.ZipFile(archive.path) as zf:
+                self.assertEqual(
+                    zf.getinfo("album/cover.jpg").compress_type, zipfile.ZIP_STORED
+                )
+                self.assertEqual(
+                    zf.getinfo("album/notes.txt").compress_type, zipfile.ZIP_DEFLATED
+                )
+
+    def test_archive_strategy_streams_large_files(self):
+        """Test that files larger than one read chunk are archived intact."""
+        album = self.source_dir / "album"
+        album.mkdir()
+        data = b" ".join(str(i * i).encode() for i in range(300000))
+        (album / "volume.bin").write_bytes(data)
+
+        sizes = {}
+        for level in (1, 9):
+            archive = ArchiveStrategy(compression_level=level).execute(
+                album, self.dest_dir / str(level)
+            )
+            with zipfile.ZipFile(archive.path) as zf:
+                self.assertEqual(zf.read("album/volume.bin"), data)
+                info = zf.getinfo("album/volume.bin")
+                self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+                sizes[level] = info.compress_size
+        # The archive's compression level reaches the streamed entries
+        self.assertLess(sizes[9], sizes[1])
+        self.assertLess(sizes[1], len(data))
+
+    def test_move_strategy_creates_destination_directory(self):
+        """Test moving a file into a directory that does not exist yet."""
+        destination = self.dest_dir / "new" / "test.txt"
+
+        result = MoveFileStrategy().execute(FilePath(self.test_file), destination)
+        self.assertEqual(result.path, destination.resolve())
+        self.assertTrue(destination.exists())
+        self.assertFalse(self.test_file.exists())
+
+    def test_move_strategy_falls_back_across_devices(self):
+        """Test that moving copies the file when a rename is not possible."""
+        destination = self.dest_dir / "test.txt"
+
+        with mock.patch(
+            "collection_sorter.strategies.strategies.os.replace",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            MoveFileStrategy().execute(FilePath(self.test_file), destination)
+        self.assertEqual(destination.read_text(), "Test content")
+        self.assertFalse(self.test_file.exists())
+
+    def test_move_strategy_reraises_other_rename_errors(self):
+        """Test that rename errors other than EXDEV are not retried."""
+        with mock.patch(
+            "collection_sorter.strategies.strategies.os.replace",
+            side_effect=OSError(errno.EACCES, "Permission denied"),
+        ), mock.patch("collection_sorter.strategies.strategies.shutil.move") as move:
+            with self.assertRaises(Exception):
+                MoveFileStrategy().execute(
+                    FilePath(self.test_file), self.dest_dir / "test.txt"
+                )
+        move.assert_not_called()
+        self.assertTrue(self.test_file.exists())
+
+    def test_file_path_treats_unreachable_paths_as_missing(self):
+        """Test that symlink loops and overlong names count as missing paths."""
+        path = self.test_file.resolve()
+        for code in (errno.ELOOP, errno.ENAMETOOLONG):
+            # Older pathlib resolve() stats the path itself, so skip it here
+            with mock.patch.object(Path, "resolve", return_value=path), mock.patch(
+                "collection_sorter.files.paths.os.stat",
+                side_effect=OSError(code, os.strerror(code)),
+            ):
+                self.assertIsNotNone(FilePath(path, must_exist=False))
+                with self.assertRaises(FileOperationError):
+                    FilePath(path)
+
+    def test_copy_strategy_numbers_past_existing_copies(self):
+        """Test that a duplicate gets the first free numbered name."""
+        (self.dest_dir / "test.txt").write_text("Existing")
+        (self.dest_dir / "test_1.txt").write_text("Existing copy")
+
+        result = CopyFileStrategy().execute(
+            FilePath(self.test_file), self.dest_dir / "test.txt"
+        )
+        self.assertEqual(result.path, self.dest_dir.resolve() / "test_2.txt")
+        self.assertEqual(result.path.read_text(), "Test content")
+
+    def test_extract_strategy_renames_existing_directory(self):
+        """Test extracting next to a directory that already has the name."""
+        archive = self.source_dir / "album.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("track.txt", "Track")
+        (self.source_dir / "album").mkdir()
+
+        result = ExtractArchiveStrategy().execute(archive)
+        self.assertEqual(result.path, self.source_dir.resolve() / "album_1")
+        self.assertTrue((result.path / "track.txt").exists())
+
+    def test_extract_strategy_uses_free_directory_names(self):
+        """Test extracting to directories that do not exist yet."""
+        archive = self.source_dir / "album.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("track.txt", "Track")
+
+        result = ExtractArchiveStrategy().execute(archive)
+        self.assertEqual(result.path, self.source_dir.resolve() / "album")
+        self.assertTrue((result.path / "track.txt").exists())
+
+        destination = self.dest_dir / "extracted"
+        result = ExtractArchiveStrategy().execute(archive, destination)
+        self.assertEqual(result.path, destination.resolve())
+        self.assertTrue((destination / "track.txt").exists())
+
     def test_file_processor(self):
         """Test the file processor with strategies."""
         # Create a processor
@@ -5,6 +5,7 @@ from pathlib import Path
 import tempfile
 import os
 import shutil
+import zipfile
 from unittest.mock import MagicMock, patch
 
 from collection_sorter.files import FilePath
@@ -390,7 +391,109 @@ class TestMangaProcessorTemplate(unittest.TestCase):
         self.assertGreater(stats["moved"], 0)
         for manga_dir in self.manga_dirs:
             self.assertFalse(manga_dir.exists())
-    
+
+    def test_archive_stores_images(self):
+        """Test that images are stored and other files are deflated."""
+        (self.manga_dirs[0] / "info.txt").write_text("notes " * 100)
+        processor = MangaProcessorTemplate(
+            source_path=self.source_dir,
+            destination_path=self.dest_dir,
+            template_func=simple_template_function,
+            archive=True
+        )
+        self.assertTrue(processor.execute().is_success())
+
+        archive = self.dest_dir / "StarAuthor" / "Space Manga.zip"
+        with zipfile.ZipFile(archive) as zf:
+            types = {
+                Path(info.filename).name: info.compress_type
+                for info in zf.infolist()
+            }
+        self.assertEqual(types["page1.jpg"], zipfile.ZIP_STORED)
+        self.assertEqual(types["info.txt"], zipfile.ZIP_DEFLATED)
+
+    def test_author_directory_created_once(self):
+        """Test that an author directory is created once for all their manga."""
+        second = self.source_dir / "[StarAuthor] Other Manga"
+        second.mkdir()
+        (second / "page1.jpg").touch()
+        processor = MangaProcessorTemplate(
+            source_path=self.source_dir,
+            destination_path=self.dest_dir,
+            template_func=simple_template_function,
+            archive=True,
+            max_workers=1
+        )
+
+        with patch("os.makedirs", wraps=os.makedirs) as makedirs:
+            self.assertTrue(processor.execute().is_success())
+
+        author_dir = os.path.join(self.dest_dir.resolve(), "StarAuthor")
+        calls = [c for c in makedirs.call_args_list if c.args[0] == author_dir]
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(list(Path(author_dir).glob("*.zip"))), 2)
+
+    def test_parallel_matches_sequential(self):
+        """Test that worker threads produce the same archives and stats."""
+        stats = {}
+        archives = {}
+        for max_workers in (1, 4):
+            dest_dir = self.test_dir / f"destination_{max_workers}"
+            processor = MangaProcessorTemplate(
+                source_path=self.source_dir,
+                destination_path=dest_dir,
+                template_func=simple_template_function,
+                archive=True,
+                max_workers=max_workers
+            )
+            result = processor.execute()
+            self.assertTrue(result.is_success())
+            stats[max_workers] = result.unwrap()
+            archives[max_workers] = sorted(
+                p.relative_to(dest_dir) for p in dest_dir.glob("**/*.zip")
+            )
+
+        self.assertEqual(stats[1], stats[4])
+        self.assertEqual(archives[1], archives[4])
+        self.assertEqual(stats[4]["archived"], len(self.manga_dirs))
+
+    def test_author_folders_archive_parallel(self):
+        """Test archiving author folders with several workers."""
+        processor = MangaProcessorTemplate(
+            source_path=self.source_dir,
+            destination_path=self.dest_dir,
+            template_func=simple_template_function,
+            author_folders=True,
+            archive=True,
+            max_workers=4
+        )
+        result = processor.execute()
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.unwrap()["archived"], len(self.manga_dirs))
+
+        archives = sorted(p.name for p in (self.dest_dir / "source").glob("*.zip"))
+        self.assertEqual(archives, ["Earth Manga.zip", "Moon Manga.zip", "Space Manga.zip"])
+
+    def test_author_folders_copy_keeps_existing_files(self):
+        """Test copying an author folder into a destination that has files."""
+        existing = self.dest_dir / "source" / "[StarAuthor] Space Manga" / "page1.jpg"
+        existing.parent.mkdir(parents=True)
+        existing.write_bytes(b"existing page")
+
+        processor = MangaProcessorTemplate(
+            source_path=self.source_dir,
+            destination_path=self.dest_dir,
+            template_func=simple_template_function,
+            author_folders=True
+        )
+        result = processor.execute()
+        self.assertTrue(result.is_success())
+
+        self.assertEqual(existing.read_bytes(), b"existing page")
+        self.assertTrue((existing.parent / "page2.jpg").exists())
+        self.assertTrue((self.dest_dir / "source" / "test_file.txt").exists())
+        self.assertTrue(self.manga_dirs[0].exists())
+
     def test_edge_case_unicode_manga_names(self):
         """Test processing manga with unicode characters in names."""
         try:
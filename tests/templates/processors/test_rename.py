@@ -1,5 +1,6 @@
 """Tests for rename processor with validation."""
 
+import errno
 import unittest
 from pathlib import Path
 import tempfile
@@ -390,6 +391,26 @@ class TestRenameProcessorTemplate(unittest.TestCase):
         except Exception as e:
             self.skipTest(f"Test skipped due to implementation differences: {e}")
     
+    def test_move_in_place_falls_back_across_devices(self):
+        """Test that renaming copies the file when rename() is not possible."""
+        processor = RenameProcessorTemplate(
+            source_path=self.source_dir,
+            patterns=self.patterns,
+            recursive=False,
+            move_source=True,
+        )
+
+        with patch(
+            "collection_sorter.templates.processors.rename.os.rename",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            result = processor.execute()
+
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.unwrap()["errors"], 0)
+        self.assertTrue((self.source_dir / "number-123.txt").exists())
+        self.assertFalse(self.number_file.exists())
+
     def test_edge_case_unicode_filenames(self):
         """Test renaming with unicode filenames."""
         unicode_file = self.source_dir / "fileüniçöde.txt"
@@ -4,9 +4,13 @@ Tests for the Template Method pattern implementation.
 
 import shutil
 import tempfile
+import threading
+import time
 import unittest
+import zipfile
 from pathlib import Path
 
+from collection_sorter.files import FilePath
 from collection_sorter.files.duplicates import DuplicateHandler, DuplicateStrategy
 from collection_sorter.result import Result, OperationError, ErrorType
 from collection_sorter.templates.templates import (
@@ -249,6 +253,37 @@ class TestTemplateMethod(unittest.TestCase):
         self.assertTrue(expected_path.exists())
         self.assertFalse(self.sub_dir.exists())  # Source should be gone
     
+    def test_directory_template_missing_source(self):
+        """Test that a missing or non-directory source is reported."""
+        archiver = ArchiveDirectoryTemplate(dry_run=False)
+
+        result = archiver.process_directory(self.source_dir / "missing", self.dest_dir)
+        self.assertTrue(result.is_failure())
+        self.assertEqual(result.error().type, ErrorType.FILE_NOT_FOUND)
+
+        result = archiver.process_directory(self.test_file, self.dest_dir)
+        self.assertTrue(result.is_failure())
+        self.assertEqual(result.error().type, ErrorType.INVALID_PATH)
+
+    def test_archive_directory_stores_media(self):
+        """Test that already compressed files are stored without deflating."""
+        album_dir = self.source_dir / "album"
+        album_dir.mkdir()
+        (album_dir / "cover.JPG").write_bytes(b"image data" * 100)
+        (album_dir / "notes.txt").write_text("Notes " * 100)
+
+        archiver = ArchiveDirectoryTemplate(dry_run=False)
+        result = archiver.process_directory(album_dir, self.dest_dir)
+
+        self.assertTrue(result.is_success())
+        with zipfile.ZipFile(result.unwrap().path) as zf:
+            compression = {
+                Path(info.filename).name: info.compress_type
+                for info in zf.infolist()
+            }
+        self.assertEqual(compression["cover.JPG"], zipfile.ZIP_STORED)
+        self.assertEqual(compression["notes.txt"], zipfile.ZIP_DEFLATED)
+
     def test_batch_processor_template(self):
         """Test the BatchProcessorTemplate class."""
         # Create multiple source files and directories
@@ -297,6 +332,81 @@ class TestTemplateMethod(unittest.TestCase):
             self.assertTrue(dir_path.exists())
             self.assertTrue((dir_path / "file.txt").exists())
     
+    def test_batch_processor_template_parallel(self):
+        """Test the BatchProcessorTemplate class with several workers."""
+        sources = []
+        for i in range(4):
+            dir_path = self.source_dir / f"parallel_dir{i}"
+            dir_path.mkdir()
+            with open(dir_path / "file.txt", "w") as f:
+                f.write(f"Directory {i} content")
+            sources.append(dir_path)
+
+        batch_processor = BatchProcessorTemplate(
+            directory_processor=DirectoryCopyTemplate(dry_run=False, recursive=True),
+            continue_on_error=True,
+            max_workers=4,
+        )
+
+        destination_dir = self.dest_dir / "parallel"
+        result = batch_processor.process_batch(sources, destination_dir)
+
+        # Results keep the order of the sources
+        self.assertTrue(result.is_success())
+        self.assertEqual(
+            [path.name for path in result.unwrap()],
+            [source.name for source in sources],
+        )
+        for i in range(4):
+            dir_path = destination_dir / f"parallel_dir{i}"
+            self.assertTrue((dir_path / "file.txt").exists())
+
+    def test_batch_processor_reuses_file_paths(self):
+        """Test that FilePath sources are validated without rebuilding them."""
+        source = FilePath(self.test_file)
+        batch_processor = BatchProcessorTemplate(file_processor=FileCopyTemplate())
+
+        result = batch_processor._validate_sources([source, str(self.test_file)])
+
+        self.assertTrue(result.is_success())
+        validated = result.unwrap()
+        self.assertIs(validated[0], source)
+        self.assertEqual(validated[1].path, source.path)
+
+    def test_batch_processor_template_parallel_same_name(self):
+        """Test that sources writing the same target never run concurrently."""
+        sources = []
+        for parent in ("a", "b", "c"):
+            dir_path = self.source_dir / parent / "shared"
+            dir_path.mkdir(parents=True)
+            sources.append(dir_path)
+        (self.source_dir / "other").mkdir()
+        sources.append(self.source_dir / "other")
+
+        lock = threading.Lock()
+        active = set()
+        overlapping = []
+
+        class TrackingTemplate(DirectoryCopyTemplate):
+            def process_directory(self, source, destination=None, **kwargs):
+                with lock:
+                    if destination.path in active:
+                        overlapping.append(destination.path)
+                    active.add(destination.path)
+                time.sleep(0.05)
+                with lock:
+                    active.discard(destination.path)
+                return Result.success(source.path)
+
+        batch_processor = BatchProcessorTemplate(
+            directory_processor=TrackingTemplate(), max_workers=4
+        )
+        result = batch_processor.process_batch(sources, self.dest_dir / "shared")
+
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.unwrap(), [source.resolve() for source in sources])
+        self.assertEqual(overlapping, [])
+
     def test_custom_file_processor(self):
         """Test a custom file processor."""
         # Create a custom processor